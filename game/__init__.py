@@ -0,0 +1,21 @@
+"""
+Call Break Game Logic Module
+
+This module contains the core game logic for Call Break card game.
+"""
+
+from .card import Card, Deck
+from .player import Player
+from .game_logic import GameState
+from .trick_validator import determine_trick_winner, validate_card_play
+from .scoring import calculate_score
+
+__all__ = [
+    'Card',
+    'Deck',
+    'Player',
+    'GameState',
+    'determine_trick_winner',
+    'validate_card_play',
+    'calculate_score'
+]
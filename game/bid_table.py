@@ -0,0 +1,168 @@
+"""
+Precomputed bid expectations for Call Break.
+
+The table is generated offline by game.simulator (python -m game.simulator)
+and shipped as assets/data/bid_table.json. It maps a trump-relative hand
+shape to the expected tricks and the bid with the best expected score under
+calculate_score, per player count. Loading is a single JSON read; each
+lookup is a dict access, so the host can auto-bid and clients can pre-fill
+the bid slider without NumPy.
+
+Hand shape (all counts include two-deck duplicates):
+- trump length (capped at TRUMP_LEN_CAP)
+- trump honors Q/K/A (capped at 3)
+- side-suit aces and kings (each capped at 3)
+- short side suits holding 0-1 cards
+"""
+
+import json
+import os
+from typing import Iterable, Optional, Tuple
+
+from .card_engine import ID_RANK, ID_SUIT, NO_SUIT, NUM_SUITS, suit_index
+
+TABLE_VERSION = 1
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'assets', 'data', 'bid_table.json'
+)
+
+TRUMP_LEN_CAP = 10
+HONOR_CAP = 3
+HONOR_RANK = 10  # rank index of Q
+ACE_RANK = 12
+KING_RANK = 11
+
+_cached_table: Optional['BidTable'] = None
+_cache_loaded = False
+
+
+def shape_features(card_ids: Iterable[int], trump: int) -> Tuple[int, int, int, int, int]:
+    """
+    Trump-relative shape of a hand.
+
+    Args:
+        card_ids: Card IDs held (0-51, duplicates allowed)
+        trump: Trump suit index (NO_SUIT if not chosen)
+
+    Returns:
+        (trump_len, trump_honors, side_aces, side_kings, short_suits)
+    """
+    suit_counts = [0] * NUM_SUITS
+    honors = aces = kings = 0
+    for cid in card_ids:
+        suit = ID_SUIT[cid]
+        rank = ID_RANK[cid]
+        suit_counts[suit] += 1
+        if suit == trump:
+            if rank >= HONOR_RANK:
+                honors += 1
+        elif rank == ACE_RANK:
+            aces += 1
+        elif rank == KING_RANK:
+            kings += 1
+    trump_len = suit_counts[trump] if trump != NO_SUIT else 0
+    short = sum(1 for s in range(NUM_SUITS) if s != trump and suit_counts[s] <= 1)
+    return (
+        min(trump_len, TRUMP_LEN_CAP),
+        min(honors, HONOR_CAP),
+        min(aces, HONOR_CAP),
+        min(kings, HONOR_CAP),
+        min(short, 3),
+    )
+
+
+def shape_keys(features: Tuple[int, ...]) -> Tuple[str, str]:
+    """Exact and coarse (trump length + honors) table keys for a shape."""
+    exact = '.'.join(str(f) for f in features)
+    coarse = f"{features[0]}.{features[1]}"
+    return exact, coarse
+
+
+class BidTable:
+    """
+    Lookup over a loaded bid table.
+
+    Attributes:
+        version: Table format version (TABLE_VERSION)
+        configs: Per player count entries: {'cards', 'default', 'coarse', 'shapes'}
+        meta: Generation details (policy, rounds, seed)
+    """
+
+    def __init__(self, data: dict):
+        if data.get('version') != TABLE_VERSION:
+            raise ValueError(f"Unsupported bid table version: {data.get('version')}")
+        self.version = data['version']
+        self.configs = {int(k): v for k, v in data.get('configs', {}).items()}
+        self.meta = data.get('meta', {})
+
+    def lookup(self, cards, trump_suit: Optional[str], num_players: int) -> Optional[Tuple[float, int]]:
+        """
+        Expected tricks and suggested bid for a hand.
+
+        Falls back from the exact shape to the coarse shape to the player
+        count default.
+
+        Args:
+            cards: Card objects in hand
+            trump_suit: Trump suit name for the round
+            num_players: Players at the table
+
+        Returns:
+            (expected_tricks, bid) or None if the player count is not covered
+        """
+        config = self.configs.get(num_players)
+        if config is None:
+            return None
+        features = shape_features((c.card_id for c in cards), suit_index(trump_suit))
+        exact, coarse = shape_keys(features)
+        entry = config['shapes'].get(exact) or config['coarse'].get(coarse) or config['default']
+        return entry[0], entry[1]
+
+    def suggest_bid(self, cards, trump_suit: Optional[str], num_players: int) -> int:
+        """Suggested bid clamped to 1..len(cards); 1 if not covered."""
+        found = self.lookup(cards, trump_suit, num_players)
+        bid = found[1] if found else 1
+        return max(1, min(bid, len(cards) or 1))
+
+
+def load_bid_table(path: Optional[str] = None) -> Optional[BidTable]:
+    """
+    Load (and cache) the bid table.
+
+    Args:
+        path: JSON file to load (defaults to DEFAULT_TABLE_PATH, cached)
+
+    Returns:
+        BidTable, or None if the file is missing or incompatible
+    """
+    global _cached_table, _cache_loaded
+    if path is None and _cache_loaded:
+        return _cached_table
+    table = None
+    try:
+        with open(path or DEFAULT_TABLE_PATH, 'r', encoding='utf-8') as f:
+            table = BidTable(json.load(f))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Bid table unavailable: {e}")
+    if path is None:
+        _cached_table, _cache_loaded = table, True
+    return table
+
+
+def suggest_bid(cards, trump_suit: Optional[str], num_players: int) -> int:
+    """
+    Suggested bid for a hand from the shipped table.
+
+    Args:
+        cards: Card objects in hand
+        trump_suit: Trump suit name for the round
+        num_players: Players at the table
+
+    Returns:
+        Bid in 1..len(cards) (1 if no table is available)
+    """
+    table = load_bid_table()
+    if table is None:
+        return 1
+    return table.suggest_bid(cards, trump_suit, num_players)
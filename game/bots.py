@@ -0,0 +1,436 @@
+"""
+Computer players for Call Break.
+
+Bots act for seats that are empty, disconnected or out of time. Trump and
+bids come from the precomputed bid table (game.bid_table). Card play uses
+determinized Monte Carlo: the unseen cards are dealt at random to the other
+seats (respecting voids they have shown), every legal candidate is played
+out to the end of the round with a fast greedy policy on card_engine masks,
+and the candidate with the best average round score is chosen.
+
+Rollouts run in a worker process pool (RolloutPool) and every decision has
+a hard time budget. When the budget runs out the bot answers with the
+rollouts it has, or with the greedy choice if it has none, so a bot never
+stalls the table.
+"""
+
+import concurrent.futures
+import os
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .bid_table import load_bid_table, suggest_bid
+from .card import Card
+from .card_engine import (
+    ABOVE_RANK,
+    CARDS_PER_DECK,
+    ID_RANK,
+    ID_SUIT,
+    NO_SUIT,
+    NUM_RANKS,
+    NUM_SUITS,
+    CompactHand,
+    TrickState,
+    card_id,
+    highest_rank,
+    suit_index,
+)
+from .player import Player
+from .scoring import calculate_score
+
+DEFAULT_TIME_BUDGET = 0.5  # seconds per card decision
+MAX_ROLLOUTS = 2000  # per worker task; keeps trivial endgames from spinning
+
+
+def lowest_rank(mask: int) -> int:
+    """Lowest rank index in a suit mask (-1 if empty)."""
+    return (mask & -mask).bit_length() - 1
+
+
+class PlayView:
+    """
+    Everything one seat may know when choosing a card (picklable).
+
+    Attributes:
+        hand: Own card IDs
+        trump: Trump suit index
+        trick: Card IDs in the current trick, in play order
+        seat: Own seat index (seats follow play order)
+        hand_sizes: Cards left per seat
+        unseen: Card IDs not in own hand and not yet played
+        voids: Per-seat 4-bit masks of suits the seat has shown it lacks
+        bid: Own bid this round
+        won: Own tricks won so far this round
+    """
+
+    __slots__ = ('hand', 'trump', 'trick', 'seat', 'hand_sizes', 'unseen', 'voids', 'bid', 'won')
+
+    def __init__(self, hand: List[int], trump: int, trick: List[int], seat: int,
+                 hand_sizes: List[int], unseen: List[int], voids: List[int],
+                 bid: int, won: int):
+        self.hand = hand
+        self.trump = trump
+        self.trick = trick
+        self.seat = seat
+        self.hand_sizes = hand_sizes
+        self.unseen = unseen
+        self.voids = voids
+        self.bid = bid
+        self.won = won
+
+    @property
+    def num_players(self) -> int:
+        return len(self.hand_sizes)
+
+
+def build_play_view(player: Player, seat_order: Sequence[Player],
+                    current_trick: Sequence[Tuple[str, object]],
+                    completed_tricks: Sequence[Sequence[Tuple[str, object]]],
+                    trump_suit: Optional[str], num_decks: int) -> PlayView:
+    """
+    Build a seat's view from server state without peeking at other hands.
+
+    Args:
+        player: Seat to act
+        seat_order: Players in play order
+        current_trick: (player_id, Card) pairs in the current trick
+        completed_tricks: This round's finished tricks as (player_id, Card or str) pairs
+        trump_suit: Trump suit name
+        num_decks: Decks in the shoe (1 or 2)
+
+    Returns:
+        PlayView for the player
+    """
+    seats = {p.player_id: i for i, p in enumerate(seat_order)}
+    trump = suit_index(trump_suit)
+    remaining = [num_decks] * CARDS_PER_DECK
+    voids = [0] * len(seat_order)
+
+    for trick in list(completed_tricks) + [current_trick]:
+        led = NO_SUIT
+        for pid, card in trick:
+            cid = (card if isinstance(card, Card) else Card.from_string(card)).card_id
+            remaining[cid] -= 1
+            suit = ID_SUIT[cid]
+            if led == NO_SUIT:
+                led = suit
+            elif suit != led and pid in seats:
+                voids[seats[pid]] |= 1 << led
+                if trump != NO_SUIT and suit != trump:
+                    voids[seats[pid]] |= 1 << trump
+
+    hand = [c.card_id for c in player.hand]
+    for cid in hand:
+        remaining[cid] -= 1
+    unseen = [cid for cid in range(CARDS_PER_DECK) for _ in range(max(remaining[cid], 0))]
+    return PlayView(
+        hand=hand,
+        trump=trump,
+        trick=[card.card_id for _, card in current_trick],
+        seat=seats[player.player_id],
+        hand_sizes=[len(p.hand) for p in seat_order],
+        unseen=unseen,
+        voids=voids,
+        bid=player.current_bid,
+        won=player.tricks_won_this_round,
+    )
+
+
+# ---------- Greedy policy and rollouts ----------
+
+def greedy_card(masks: Sequence[int], state: TrickState) -> int:
+    """
+    Fast default policy: lead the highest side card, otherwise win as
+    cheaply as possible or throw the cheapest card (trumps last).
+    """
+    legal = state.legal_masks(masks)
+    trump = state.trump
+    if not state.cards:
+        best_suit, best_rank = NO_SUIT, -1
+        for suit in range(NUM_SUITS):
+            if suit != trump and legal[suit]:
+                rank = highest_rank(legal[suit])
+                if rank > best_rank:
+                    best_suit, best_rank = suit, rank
+        if best_suit == NO_SUIT:
+            return card_id(trump, highest_rank(legal[trump]))
+        return card_id(best_suit, best_rank)
+
+    top = state.cards[state.winner]
+    top_suit = ID_SUIT[top]
+    winners = legal[top_suit] & ABOVE_RANK[ID_RANK[top]]
+    if winners:
+        return card_id(top_suit, lowest_rank(winners))
+    if trump != NO_SUIT and top_suit != trump and legal[trump]:
+        return card_id(trump, lowest_rank(legal[trump]))
+
+    cheap_suit, cheap_rank = NO_SUIT, NUM_RANKS
+    for suit in range(NUM_SUITS):
+        if suit != trump and legal[suit]:
+            rank = lowest_rank(legal[suit])
+            if rank < cheap_rank:
+                cheap_suit, cheap_rank = suit, rank
+    if cheap_suit == NO_SUIT:
+        return card_id(trump, lowest_rank(legal[trump]))
+    return card_id(cheap_suit, cheap_rank)
+
+
+def determinize(view: PlayView, rng: random.Random) -> List[CompactHand]:
+    """Deal the unseen cards to the other seats, honoring known voids where possible."""
+    pool = list(view.unseen)
+    rng.shuffle(pool)
+    hands: List[Optional[CompactHand]] = [None] * view.num_players
+    hands[view.seat] = CompactHand(view.hand)
+    # Most constrained seats first so voids are rarely violated
+    others = sorted((s for s in range(view.num_players) if s != view.seat),
+                    key=lambda s: -bin(view.voids[s]).count('1'))
+    for seat in others:
+        need = view.hand_sizes[seat]
+        taken, rest = [], []
+        for cid in pool:
+            if len(taken) < need and not view.voids[seat] >> ID_SUIT[cid] & 1:
+                taken.append(cid)
+            else:
+                rest.append(cid)
+        short = need - len(taken)
+        if short > 0:
+            # Inconsistent inference (or bad luck): relax the void constraint
+            taken.extend(rest[:short])
+            rest = rest[short:]
+        hands[seat] = CompactHand(taken)
+        pool = rest
+    return hands
+
+
+def play_out(hands: List[CompactHand], state: TrickState, next_seat: int, seat: int) -> int:
+    """
+    Finish the round with greedy play.
+
+    Args:
+        hands: Per-seat hands (consumed)
+        state: Current trick (may be complete)
+        next_seat: Seat to act next in the current trick
+        seat: Seat whose tricks are counted
+
+    Returns:
+        Tricks won by seat from the current trick onward
+    """
+    num_players = len(hands)
+    leader = (next_seat - len(state.cards)) % num_players
+    won = 0
+    while True:
+        while len(state.cards) < num_players:
+            actor = (leader + len(state.cards)) % num_players
+            cid = greedy_card(hands[actor].masks, state)
+            hands[actor].remove(cid)
+            state.play(cid)
+        leader = (leader + state.winner) % num_players
+        if leader == seat:
+            won += 1
+        if not hands[leader].size:
+            return won
+        state = TrickState(state.trump)
+
+
+def evaluate_candidates(view: PlayView, candidates: List[int], budget: float,
+                        seed: int, max_rollouts: int = MAX_ROLLOUTS) -> Tuple[List[float], int]:
+    """
+    Monte Carlo rollouts for each candidate card until the budget expires.
+
+    Runs in a pool worker (or inline). Every determinization is shared by
+    all candidates so their averages are directly comparable.
+
+    Returns:
+        (total round score per candidate, determinizations played)
+    """
+    deadline = time.monotonic() + budget
+    rng = random.Random(seed)
+    max_tricks = len(view.hand) + view.won + 1
+    scorer = Player('bot', 'Bot')
+    scorer.current_bid = view.bid
+    scores = []
+    for won in range(max_tricks + 1):
+        scorer.tricks_won_this_round = won
+        scores.append(calculate_score(scorer) if view.bid else float(won))
+
+    totals = [0.0] * len(candidates)
+    next_seat = (view.seat + 1) % view.num_players
+    rollouts = 0
+    while rollouts < max_rollouts and time.monotonic() < deadline:
+        deal = determinize(view, rng)
+        for i, cid in enumerate(candidates):
+            hands = [hand.copy() for hand in deal]
+            hands[view.seat].remove(cid)
+            state = TrickState(view.trump)
+            for played in view.trick:
+                state.play(played)
+            state.play(cid)
+            won = view.won + play_out(hands, state, next_seat, view.seat)
+            totals[i] += scores[min(won, max_tricks)]
+        rollouts += 1
+    return totals, rollouts
+
+
+class RolloutPool:
+    """
+    Lazily started process pool for rollouts, with an inline fallback.
+
+    Platforms without working multiprocessing (e.g. some Android builds)
+    run rollouts in the calling thread under the same time budget.
+
+    Attributes:
+        workers: Worker processes (0 = always inline)
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = min(4, os.cpu_count() or 1) if workers is None else workers
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            try:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, ImportError, NotImplementedError) as e:
+                print(f"⚠️ Bot process pool unavailable, running inline: {e}")
+                self.workers = 0
+        return self._executor
+
+    def evaluate(self, view: PlayView, candidates: List[int], budget: float,
+                 seed: int) -> Tuple[List[float], int]:
+        """
+        Spread rollouts over the workers and merge what returns in time.
+
+        Returns:
+            (total score per candidate, determinizations played)
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return evaluate_candidates(view, candidates, budget, seed)
+        # Workers stop themselves at the budget; the margin covers IPC
+        deadline = time.monotonic() + budget
+        worker_budget = budget * 0.85
+        try:
+            futures = [executor.submit(evaluate_candidates, view, candidates, worker_budget, seed + i)
+                       for i in range(self.workers)]
+        except RuntimeError as e:  # Broken or shut down pool
+            print(f"⚠️ Bot process pool failed, running inline: {e}")
+            self.shutdown()
+            self.workers = 0
+            return evaluate_candidates(view, candidates, worker_budget, seed)
+        done, _ = concurrent.futures.wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        totals = [0.0] * len(candidates)
+        rollouts = 0
+        for future in done:
+            try:
+                part, count = future.result()
+            except Exception as e:
+                print(f"⚠️ Bot rollout worker error: {e}")
+                continue
+            totals = [a + b for a, b in zip(totals, part)]
+            rollouts += count
+        return totals, rollouts
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# ---------- Bots ----------
+
+class Bot:
+    """
+    Pluggable bot interface used by the servers.
+
+    Subclasses override any of choose_trump, choose_bid and choose_card.
+    All three must return quickly and always return a legal answer.
+    """
+
+    name = 'bot'
+
+    def choose_trump(self, hand: List[Card], num_players: int) -> str:
+        """Pick the suit with the most expected tricks (longest suit without a table)."""
+        table = load_bid_table()
+        if table is not None:
+            expected = {}
+            for suit in Card.SUITS:
+                found = table.lookup(hand, suit, num_players)
+                expected[suit] = found[0] if found else 0.0
+            return max(Card.SUITS, key=lambda s: expected[s])
+        return max(Card.SUITS, key=lambda s: sum(1 for c in hand if c.suit == s))
+
+    def choose_bid(self, hand: List[Card], trump_suit: Optional[str], num_players: int) -> int:
+        """Bid the table suggestion for this hand."""
+        return suggest_bid(hand, trump_suit, num_players)
+
+    def choose_card(self, view: PlayView, valid_cards: List[Card]) -> Card:
+        """Greedy card from the legal set."""
+        state = TrickState(view.trump)
+        for cid in view.trick:
+            state.play(cid)
+        cid = greedy_card(CompactHand(view.hand).masks, state)
+        return next((c for c in valid_cards if c.card_id == cid), valid_cards[0])
+
+
+class GreedyBot(Bot):
+    """Table trump/bids and greedy card play; no search."""
+
+    name = 'greedy'
+
+
+class MonteCarloBot(Bot):
+    """
+    Determinized Monte Carlo card play under a strict time budget.
+
+    Attributes:
+        time_budget: Seconds allowed per card decision
+        pool: RolloutPool running the rollouts
+    """
+
+    name = 'montecarlo'
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET,
+                 pool: Optional[RolloutPool] = None, seed: Optional[int] = None):
+        self.time_budget = time_budget
+        self.pool = pool or RolloutPool()
+        self.rng = random.Random(seed)
+
+    def choose_card(self, view: PlayView, valid_cards: List[Card]) -> Card:
+        candidates = sorted({c.card_id for c in valid_cards})
+        if len(candidates) == 1:
+            return valid_cards[0]
+        totals, rollouts = self.pool.evaluate(view, candidates, self.time_budget,
+                                              self.rng.randrange(1 << 30))
+        if not rollouts:
+            return super().choose_card(view, valid_cards)
+        best = candidates[max(range(len(candidates)), key=lambda i: totals[i])]
+        return next(c for c in valid_cards if c.card_id == best)
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+
+BOT_TYPES: Dict[str, type] = {
+    GreedyBot.name: GreedyBot,
+    MonteCarloBot.name: MonteCarloBot,
+}
+
+
+def create_bot(kind: str = MonteCarloBot.name, **kwargs) -> Bot:
+    """
+    Create a bot by name.
+
+    Args:
+        kind: Key of BOT_TYPES ('greedy' or 'montecarlo')
+        **kwargs: Passed to the bot constructor
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    bot_class = BOT_TYPES.get(kind)
+    if bot_class is None:
+        raise ValueError(f"Unknown bot type: {kind}")
+    return bot_class(**kwargs)
@@ -0,0 +1,271 @@
+"""
+Compact card core for Call Break.
+
+Integer card IDs and per-suit bitmasks for hot paths (validators, bots,
+simulators). A card ID is suit_index * 13 + rank_index, so IDs 0-51 map
+to Card.SUITS x Card.RANKS in deck order. Two-deck configs use physical
+IDs 0-103; physical_id % 52 gives the card ID.
+
+Hands are per-suit 13-bit masks (bit r set = holds rank index r) plus a
+52-slot count array so duplicate cards from two decks are tracked.
+Legality and trick resolution are constant-time mask operations.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+NUM_SUITS = 4
+NUM_RANKS = 13
+CARDS_PER_DECK = NUM_SUITS * NUM_RANKS
+
+SUIT_NAMES = ('Spades', 'Hearts', 'Diamonds', 'Clubs')
+SUIT_INDEX = {name: i for i, name in enumerate(SUIT_NAMES)}
+
+# Lookup tables indexed by card ID
+ID_SUIT = tuple(cid // NUM_RANKS for cid in range(CARDS_PER_DECK))
+ID_RANK = tuple(cid % NUM_RANKS for cid in range(CARDS_PER_DECK))
+ID_BIT = tuple(1 << (cid % NUM_RANKS) for cid in range(CARDS_PER_DECK))
+
+FULL_SUIT_MASK = (1 << NUM_RANKS) - 1
+# ABOVE_RANK[r]: ranks strictly higher than rank index r (r=-1 means none played)
+ABOVE_RANK = {r: FULL_SUIT_MASK & ~((1 << (r + 1)) - 1) for r in range(-1, NUM_RANKS)}
+
+NO_SUIT = -1
+
+
+def card_id(suit_index: int, rank_index: int) -> int:
+    """Build a card ID from suit and rank indices."""
+    return suit_index * NUM_RANKS + rank_index
+
+
+def suit_index(suit: Optional[str]) -> int:
+    """Map a suit name to its index, or NO_SUIT for None/unknown."""
+    return SUIT_INDEX.get(suit, NO_SUIT) if suit else NO_SUIT
+
+
+def iter_mask(suit: int, mask: int) -> Iterator[int]:
+    """Yield card IDs for each set bit of a suit mask, lowest rank first."""
+    base = suit * NUM_RANKS
+    while mask:
+        low = mask & -mask
+        yield base + low.bit_length() - 1
+        mask ^= low
+
+
+def highest_rank(mask: int) -> int:
+    """Highest rank index in a suit mask (-1 if empty)."""
+    return mask.bit_length() - 1
+
+
+class CompactHand:
+    """
+    A hand as per-suit rank bitmasks plus per-card counts.
+
+    Attributes:
+        masks: Four 13-bit masks, one per suit (presence of each rank)
+        counts: Copies held of each card ID (0-2 with two decks)
+        size: Total cards held
+    """
+
+    __slots__ = ('masks', 'counts', 'size')
+
+    def __init__(self, card_ids: Iterable[int] = ()):
+        self.masks = [0, 0, 0, 0]
+        self.counts = bytearray(CARDS_PER_DECK)
+        self.size = 0
+        for cid in card_ids:
+            self.add(cid)
+
+    def add(self, cid: int):
+        """Add one copy of a card."""
+        self.counts[cid] += 1
+        self.masks[ID_SUIT[cid]] |= ID_BIT[cid]
+        self.size += 1
+
+    def remove(self, cid: int) -> bool:
+        """Remove one copy of a card; False if not held."""
+        count = self.counts[cid]
+        if not count:
+            return False
+        self.counts[cid] = count - 1
+        if count == 1:
+            self.masks[ID_SUIT[cid]] &= ~ID_BIT[cid]
+        self.size -= 1
+        return True
+
+    def has(self, cid: int) -> bool:
+        return self.counts[cid] > 0
+
+    def copy(self) -> 'CompactHand':
+        clone = CompactHand.__new__(CompactHand)
+        clone.masks = list(self.masks)
+        clone.counts = bytearray(self.counts)
+        clone.size = self.size
+        return clone
+
+    def card_ids(self) -> List[int]:
+        """All held card IDs (duplicates repeated), suit then rank order."""
+        ids = []
+        for suit in range(NUM_SUITS):
+            for cid in iter_mask(suit, self.masks[suit]):
+                ids.extend([cid] * self.counts[cid])
+        return ids
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def hand_masks(card_ids: Iterable[int]) -> List[int]:
+    """Per-suit presence masks for a sequence of card IDs (no counts)."""
+    masks = [0, 0, 0, 0]
+    for cid in card_ids:
+        masks[ID_SUIT[cid]] |= ID_BIT[cid]
+    return masks
+
+
+def legal_masks(masks: Sequence[int], led: int, trump: int,
+                high_trump: int = -1) -> Tuple[int, int, int, int]:
+    """
+    Per-suit masks of the cards a hand may legally play.
+
+    Args:
+        masks: Hand's per-suit masks
+        led: Led suit index (NO_SUIT when leading)
+        trump: Trump suit index (NO_SUIT if not chosen)
+        high_trump: Highest trump rank index already in the trick (-1 if none)
+
+    Returns:
+        Four masks; the union is the set of legal cards
+    """
+    if led == NO_SUIT:
+        return masks[0], masks[1], masks[2], masks[3]
+    if masks[led]:
+        legal = [0, 0, 0, 0]
+        legal[led] = masks[led]
+        return tuple(legal)
+    if trump != NO_SUIT and masks[trump]:
+        legal = [0, 0, 0, 0]
+        higher = masks[trump] & ABOVE_RANK[high_trump]
+        legal[trump] = higher or masks[trump]
+        return tuple(legal)
+    return masks[0], masks[1], masks[2], masks[3]
+
+
+def is_legal(masks: Sequence[int], cid: int, led: int, trump: int,
+             high_trump: int = -1) -> bool:
+    """Check one card against legal_masks without building the tuple."""
+    suit = ID_SUIT[cid]
+    bit = ID_BIT[cid]
+    if not masks[suit] & bit:
+        return False
+    if led == NO_SUIT or suit == led:
+        return True
+    if masks[led]:
+        return False
+    if trump == NO_SUIT or not masks[trump]:
+        return True
+    if suit != trump:
+        return False
+    higher = masks[trump] & ABOVE_RANK[high_trump]
+    return not higher or bool(bit & higher)
+
+
+def beats(cid: int, best: int, trump: int) -> bool:
+    """True if card cid beats the trick's current best card."""
+    suit = ID_SUIT[cid]
+    if suit == ID_SUIT[best]:
+        return ID_RANK[cid] > ID_RANK[best]
+    return suit == trump
+
+
+def trick_winner(card_ids: Sequence[int], trump: int, led: Optional[int] = None) -> int:
+    """
+    Position of the winning card in a trick.
+
+    Ties between identical cards (two decks) go to the first played.
+
+    Args:
+        card_ids: Card IDs in play order
+        trump: Trump suit index (NO_SUIT if none)
+        led: Led suit index (defaults to the first card's suit)
+
+    Returns:
+        Index into card_ids of the winning card
+    """
+    if led is None:
+        led = ID_SUIT[card_ids[0]]
+    best_pos = -1
+    best_suit = NO_SUIT
+    best_rank = -1
+    for pos, cid in enumerate(card_ids):
+        suit = ID_SUIT[cid]
+        rank = ID_RANK[cid]
+        if suit == best_suit:
+            if rank > best_rank:
+                best_pos, best_rank = pos, rank
+        elif suit == trump or (suit == led and best_suit != trump):
+            best_pos, best_suit, best_rank = pos, suit, rank
+    return best_pos
+
+
+class TrickState:
+    """
+    Incrementally maintained trick: led suit, current winner, highest trump.
+
+    Attributes:
+        trump: Trump suit index
+        led: Led suit index (NO_SUIT before the first card)
+        cards: Card IDs played so far
+        winner: Position of the current winning card (-1 if empty)
+        high_trump: Highest trump rank index played (-1 if none)
+    """
+
+    __slots__ = ('trump', 'led', 'cards', 'winner', 'high_trump')
+
+    def __init__(self, trump: int):
+        self.trump = trump
+        self.led = NO_SUIT
+        self.cards: List[int] = []
+        self.winner = -1
+        self.high_trump = -1
+
+    def play(self, cid: int):
+        """Add a card and update the winner in O(1)."""
+        if not self.cards:
+            self.led = ID_SUIT[cid]
+            self.winner = 0
+        elif beats(cid, self.cards[self.winner], self.trump):
+            self.winner = len(self.cards)
+        if ID_SUIT[cid] == self.trump and ID_RANK[cid] > self.high_trump:
+            self.high_trump = ID_RANK[cid]
+        self.cards.append(cid)
+
+    def legal_masks(self, masks: Sequence[int]) -> Tuple[int, int, int, int]:
+        return legal_masks(masks, self.led, self.trump, self.high_trump)
+
+    def is_legal(self, masks: Sequence[int], cid: int) -> bool:
+        return is_legal(masks, cid, self.led, self.trump, self.high_trump)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+
+# ---------- Adapters for Card / Player objects ----------
+
+def cards_to_ids(cards: Iterable) -> List[int]:
+    """Card objects to card IDs."""
+    return [c.card_id for c in cards]
+
+
+def compact_hand(cards: Iterable) -> CompactHand:
+    """Build a CompactHand from Card objects (e.g. Player.hand)."""
+    return CompactHand(c.card_id for c in cards)
+
+
+def high_trump_in(trick: Iterable[Tuple[str, object]], trump: int) -> int:
+    """Highest trump rank index in a (player_id, Card) trick list."""
+    high = -1
+    for _, card in trick:
+        cid = card.card_id
+        if ID_SUIT[cid] == trump and ID_RANK[cid] > high:
+            high = ID_RANK[cid]
+    return high
@@ -0,0 +1,337 @@
+"""
+Vectorized self-play simulator for Call Break (requires NumPy).
+
+Deals and plays a whole batch of rounds at once: hands are a
+(batch, players, 52) array of card counts, and every play step resolves
+legality, policy choice and trick winners for all games with array
+operations. Dealing mirrors Deck.shuffle + Deck.deal (contiguous slices of
+a shuffled one- or two-deck shoe), legality mirrors trick_validator
+(follow suit, else trump, else higher trump), and bids are scored with
+scoring.calculate_score.
+
+Used to build the bid expectation table shipped with the app:
+
+    python -m game.simulator --rounds 20000 --out assets/data/bid_table.json
+
+NumPy is a development dependency only; the app loads the resulting
+table with game.bid_table.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .bid_table import (
+    ACE_RANK,
+    DEFAULT_TABLE_PATH,
+    HONOR_CAP,
+    HONOR_RANK,
+    KING_RANK,
+    TABLE_VERSION,
+    TRUMP_LEN_CAP,
+    shape_keys,
+)
+from .card import get_deck_config
+from .card_engine import CARDS_PER_DECK, NUM_RANKS, NUM_SUITS
+from .player import Player
+from .scoring import calculate_score
+
+POLICY = 'greedy-v1'
+MIN_SAMPLES = 30
+
+CARD_SUIT = np.arange(CARDS_PER_DECK) // NUM_RANKS
+CARD_RANK = np.arange(CARDS_PER_DECK) % NUM_RANKS
+
+# Shape feature sizes, used to pack features into one integer code
+FEATURE_SIZES = (TRUMP_LEN_CAP + 1, HONOR_CAP + 1, HONOR_CAP + 1, HONOR_CAP + 1, 4)
+
+
+def deal_batch(rng: np.random.Generator, num_players: int, batch: int) -> np.ndarray:
+    """
+    Shuffle and deal a batch of rounds like Deck.deal.
+
+    Args:
+        rng: NumPy random generator
+        num_players: Players per round (2-12)
+        batch: Rounds to deal
+
+    Returns:
+        int8 array (batch, num_players, 52) of card counts
+    """
+    num_decks, cards_per_player, _ = get_deck_config(num_players)
+    shoe = CARDS_PER_DECK * num_decks
+    order = np.argsort(rng.random((batch, shoe)), axis=1)
+    dealt = order[:, :num_players * cards_per_player] % CARDS_PER_DECK
+    seat = np.repeat(np.arange(num_players), cards_per_player)
+    flat = (np.arange(batch)[:, None] * num_players + seat) * CARDS_PER_DECK + dealt
+    counts = np.bincount(flat.ravel(), minlength=batch * num_players * CARDS_PER_DECK)
+    return counts.reshape(batch, num_players, CARDS_PER_DECK).astype(np.int8)
+
+
+def choose_trump(rng: np.random.Generator, hands: np.ndarray) -> np.ndarray:
+    """Trump per round: a random chooser's longest suit (lowest index on ties)."""
+    batch, num_players, _ = hands.shape
+    chooser = rng.integers(num_players, size=batch)
+    chooser_hand = hands[np.arange(batch), chooser]
+    suit_lengths = chooser_hand.reshape(batch, NUM_SUITS, NUM_RANKS).sum(axis=2)
+    return suit_lengths.argmax(axis=1)
+
+
+def shape_codes(hands: np.ndarray, trump: np.ndarray) -> np.ndarray:
+    """
+    Packed bid_table.shape_features for every hand.
+
+    Args:
+        hands: (batch, players, 52) card counts
+        trump: (batch,) trump suit index
+
+    Returns:
+        (batch, players) integer codes (see decode_shape)
+    """
+    batch, num_players, _ = hands.shape
+    by_suit = hands.reshape(batch, num_players, NUM_SUITS, NUM_RANKS).astype(np.int16)
+    is_trump = (np.arange(NUM_SUITS)[None, :] == trump[:, None])[:, None, :]
+    suit_len = by_suit.sum(axis=3)
+    trump_len = np.where(is_trump, suit_len, 0).sum(axis=2)
+    honors = np.where(is_trump, by_suit[..., HONOR_RANK:].sum(axis=3), 0).sum(axis=2)
+    aces = np.where(is_trump, 0, by_suit[..., ACE_RANK]).sum(axis=2)
+    kings = np.where(is_trump, 0, by_suit[..., KING_RANK]).sum(axis=2)
+    short = ((suit_len <= 1) & ~is_trump).sum(axis=2)
+    features = (
+        np.minimum(trump_len, TRUMP_LEN_CAP),
+        np.minimum(honors, HONOR_CAP),
+        np.minimum(aces, HONOR_CAP),
+        np.minimum(kings, HONOR_CAP),
+        np.minimum(short, 3),
+    )
+    code = np.zeros((batch, num_players), dtype=np.int64)
+    for value, size in zip(features, FEATURE_SIZES):
+        code = code * size + value
+    return code
+
+
+def decode_shape(code: int) -> Tuple[int, ...]:
+    """Unpack a shape_codes value into the bid_table feature tuple."""
+    features = []
+    for size in reversed(FEATURE_SIZES):
+        code, value = divmod(int(code), size)
+        features.append(value)
+    return tuple(reversed(features))
+
+
+def legal_mask(has: np.ndarray, led: np.ndarray, trump: np.ndarray,
+               high_trump: np.ndarray) -> np.ndarray:
+    """
+    Legal cards for a batch of hands (trick_validator rules).
+
+    Args:
+        has: (batch, 52) bool, cards held
+        led: (batch,) led suit index, -1 when leading
+        trump: (batch,) trump suit index
+        high_trump: (batch,) highest trump rank in the trick, -1 if none
+
+    Returns:
+        (batch, 52) bool mask of playable cards
+    """
+    follow = has & (CARD_SUIT[None, :] == led[:, None])
+    trumps = has & (CARD_SUIT[None, :] == trump[:, None])
+    higher = trumps & (CARD_RANK[None, :] > high_trump[:, None])
+    must_trump = np.where(higher.any(axis=1)[:, None], higher, trumps)
+    legal = np.where(trumps.any(axis=1)[:, None], must_trump, has)
+    legal = np.where(follow.any(axis=1)[:, None], follow, legal)
+    return np.where((led < 0)[:, None], has, legal)
+
+
+def play_batch(hands: np.ndarray, trump: np.ndarray, leader: np.ndarray) -> np.ndarray:
+    """
+    Play out a batch of rounds with a greedy policy.
+
+    Leader plays its highest side-suit card (highest trump if only trumps
+    remain). Followers win as cheaply as possible, else throw the cheapest
+    legal card; trumps count as 13 ranks dearer than side cards.
+
+    Args:
+        hands: (batch, players, 52) card counts (consumed)
+        trump: (batch,) trump suit index
+        leader: (batch,) seat leading the first trick
+
+    Returns:
+        (batch, players) tricks won
+    """
+    batch, num_players, _ = hands.shape
+    rows = np.arange(batch)
+    tricks = np.zeros((batch, num_players), dtype=np.int16)
+    is_trump = CARD_SUIT[None, :] == trump[:, None]
+    cost = CARD_RANK[None, :] + NUM_RANKS * is_trump
+    lead_score = CARD_RANK[None, :] + NUM_RANKS * ~is_trump
+    no_suit = np.full(batch, -1)
+    cards_per_player = int(hands[0, 0].sum())
+
+    for _ in range(cards_per_player):
+        winner = leader.copy()
+        high_trump = no_suit.copy()
+        for turn in range(num_players):
+            seat = (leader + turn) % num_players
+            has = hands[rows, seat] > 0
+            if turn == 0:
+                card = np.where(has, lead_score, -1).argmax(axis=1)
+                led = CARD_SUIT[card]
+                best_suit = led
+                best_rank = CARD_RANK[card]
+            else:
+                legal = legal_mask(has, led, trump, high_trump)
+                beats = ((CARD_SUIT[None, :] == best_suit[:, None])
+                         & (CARD_RANK[None, :] > best_rank[:, None]))
+                beats |= is_trump & (best_suit != trump)[:, None]
+                winning = legal & beats
+                pool = np.where(winning.any(axis=1)[:, None], winning, legal)
+                card = np.where(pool, cost, 99).argmin(axis=1)
+                suit = CARD_SUIT[card]
+                rank = CARD_RANK[card]
+                won = ((suit == best_suit) & (rank > best_rank)) | ((suit == trump) & (best_suit != trump))
+                best_suit = np.where(won, suit, best_suit)
+                best_rank = np.where(won, rank, best_rank)
+                winner = np.where(won, seat, winner)
+            hands[rows, seat, card] -= 1
+            played_trump = CARD_SUIT[card] == trump
+            high_trump = np.where(played_trump, np.maximum(high_trump, CARD_RANK[card]), high_trump)
+        tricks[rows, winner] += 1
+        leader = winner
+    return tricks
+
+
+def simulate(num_players: int, rounds: int, seed: Optional[int] = None,
+             batch_size: int = 8192) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Deal and play rounds in batches.
+
+    Args:
+        num_players: Players per round (2-12)
+        rounds: Total rounds to play
+        seed: RNG seed for reproducible tables
+        batch_size: Rounds per vectorized batch
+
+    Returns:
+        (shape codes, tricks won), both flat arrays with one entry per hand
+    """
+    rng = np.random.default_rng(seed)
+    codes, tricks = [], []
+    remaining = rounds
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        hands = deal_batch(rng, num_players, batch)
+        trump = choose_trump(rng, hands)
+        codes.append(shape_codes(hands, trump).ravel())
+        leader = rng.integers(num_players, size=batch)
+        tricks.append(play_batch(hands, trump, leader).ravel())
+        remaining -= batch
+    return np.concatenate(codes), np.concatenate(tricks)
+
+
+def score_matrix(max_tricks: int) -> np.ndarray:
+    """
+    Round score for every (tricks won, bid) pair via calculate_score.
+
+    Returns:
+        (max_tricks + 1, max_tricks + 1) array; column 0 (no bid) unused
+    """
+    player = Player('sim', 'Sim')
+    scores = np.zeros((max_tricks + 1, max_tricks + 1))
+    for won in range(max_tricks + 1):
+        for bid in range(1, max_tricks + 1):
+            player.current_bid = bid
+            player.tricks_won_this_round = won
+            scores[won, bid] = calculate_score(player)
+    return scores
+
+
+def _summarize(group: np.ndarray, tricks: np.ndarray, max_tricks: int,
+               scores: np.ndarray, min_samples: int) -> Dict[int, list]:
+    """[expected_tricks, best_bid, samples] per group ID with enough samples."""
+    size = int(group.max()) + 1
+    hist = np.bincount(group * (max_tricks + 1) + tricks,
+                       minlength=size * (max_tricks + 1)).reshape(size, max_tricks + 1)
+    samples = hist.sum(axis=1)
+    expected = hist @ np.arange(max_tricks + 1) / np.maximum(samples, 1)
+    best_bid = (hist @ scores)[:, 1:].argmax(axis=1) + 1
+    return {
+        g: [round(float(expected[g]), 2), int(best_bid[g]), int(samples[g])]
+        for g in np.flatnonzero(samples >= min_samples)
+    }
+
+
+def build_config(num_players: int, rounds: int, seed: Optional[int] = None,
+                 min_samples: int = MIN_SAMPLES) -> dict:
+    """
+    Table entries for one player count.
+
+    Returns:
+        {'cards', 'default', 'coarse', 'shapes'}; entries are
+        [expected_tricks, bid, samples]
+    """
+    _, cards_per_player, _ = get_deck_config(num_players)
+    codes, tricks = simulate(num_players, rounds, seed)
+    tricks = tricks.astype(np.int64)
+    scores = score_matrix(cards_per_player)
+
+    shapes = {}
+    for code, entry in _summarize(codes, tricks, cards_per_player, scores, min_samples).items():
+        shapes[shape_keys(decode_shape(code))[0]] = entry
+
+    coarse_size = FEATURE_SIZES[2] * FEATURE_SIZES[3] * FEATURE_SIZES[4]
+    coarse = {}
+    for group, entry in _summarize(codes // coarse_size, tricks, cards_per_player,
+                                   scores, min_samples).items():
+        coarse[shape_keys(decode_shape(group * coarse_size))[1]] = entry
+
+    default = _summarize(np.zeros_like(codes), tricks, cards_per_player, scores, 1)[0]
+    return {'cards': cards_per_player, 'default': default, 'coarse': coarse, 'shapes': shapes}
+
+
+def build_table(rounds: int, seed: int = 0,
+                player_counts: Iterable[int] = range(2, 13)) -> dict:
+    """
+    Simulate every player count and assemble the versioned table.
+
+    Args:
+        rounds: Rounds per player count
+        seed: Base seed (player count is added per config)
+        player_counts: Player counts to cover
+
+    Returns:
+        JSON-serializable table (see game.bid_table.BidTable)
+    """
+    configs = {}
+    for num_players in player_counts:
+        start = time.perf_counter()
+        configs[str(num_players)] = build_config(num_players, rounds, seed + num_players)
+        elapsed = time.perf_counter() - start
+        print(f"  {num_players} players: {rounds} rounds in {elapsed:.1f}s "
+              f"({rounds / max(elapsed, 1e-9):,.0f} rounds/s)")
+    return {
+        'version': TABLE_VERSION,
+        'meta': {'policy': POLICY, 'rounds': rounds, 'seed': seed},
+        'configs': configs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Call Break bid expectation table")
+    parser.add_argument('--rounds', type=int, default=20000, help="Rounds per player count")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+
+    table = build_table(args.rounds, args.seed)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(table, f, separators=(',', ':'), sort_keys=True)
+    print(f"✅ Bid table v{TABLE_VERSION} written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
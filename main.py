@@ -259,7 +259,11 @@ class CallBreakApp(App):
         if player_id == self.player_id:
             self.goto_screen("bidding")
             bidding = self.screen_manager.get_screen("bidding")
-            bidding.setup_bid(message.get("min_bid", 1), message.get("max_bid", 13))
+            bidding.setup_bid(
+                message.get("min_bid", 1),
+                message.get("max_bid", 13),
+                message.get("suggested_bid"),
+            )
         else:
             game = self.screen_manager.get_screen("game")
             game.show_bidding_waiting(player_id)
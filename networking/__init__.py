@@ -0,0 +1,26 @@
+"""
+Networking Module for Call Break Game
+
+WiFi-only connections and messaging helpers.
+
+Exports are imported lazily so headless tools (e.g. the asyncio host)
+can use this package without pulling in Kivy.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'WiFiGameServer': '.wifi_server',
+    'WiFiGameClient': '.wifi_client',
+    'MessageHandler': '.message_handler',
+    'ConnectionManager': '.connection_manager',
+    'AsyncGameHost': '.async_server',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,945 @@
+"""
+Headless asyncio host for Call Break (multi-table).
+
+Runs many concurrent tables on a single port using non-blocking streams.
+Speaks the same length-prefixed JSON protocol and message types as
+WiFiGameServer, so existing WiFiGameClient instances connect unchanged.
+
+Run with: python -m networking.async_server --port 5555 --seats 4
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from .event_log import EventLog
+from .game_code import GameCodeManager
+from .message_handler import MessageHandler, MessageType
+from .wire_codec import CODEC_JSON, negotiate_codec
+from game.bots import BOT_TYPES, DEFAULT_TIME_BUDGET, Bot, MonteCarloBot, build_play_view, create_bot
+from game.card import Card
+from game.game_logic import GamePhase, GameState
+from game.player import Player
+
+
+# Pacing between game steps (seconds); mirrors WiFiGameServer's Clock delays
+DEFAULT_DELAYS = {
+    'round_start': 0.5,
+    'trump_selection': 1.0,
+    'next_bid': 1.0,
+    'playing_start': 2.0,
+    'next_card': 1.0,
+    'next_trick': 2.0,
+    'next_round': 8.0,
+    'game_end': 5.0,
+}
+
+# Zero-delay pacing for bot tables and tests
+FAST_DELAYS = {key: 0.0 for key in DEFAULT_DELAYS}
+
+SUITS = ['Spades', 'Hearts', 'Diamonds', 'Clubs']
+
+
+class TableSession:
+    """
+    One Call Break table hosted inside an AsyncGameHost.
+
+    All methods run on the host's event loop, so table state needs no locks.
+    Seats without a live connection (bot-filled or disconnected) are played
+    by the host's bot; bot decisions run in the loop's default executor and
+    are applied back on the loop.
+
+    Attributes:
+        table_id: Host-unique table number
+        game_code: Join code registered with GameCodeManager
+        seats: Number of players needed to start
+        game: Authoritative GameState for this table
+        connections: Stream writers of seated, connected players
+        codecs: Wire codec negotiated per connected player
+        event_log: Sequence-numbered ring of recent events for delta resync
+        round_number: Round currently being played (1-based)
+    """
+
+    def __init__(self, host: 'AsyncGameHost', table_id: int, game_code: str,
+                 seats: int = 4, num_rounds: int = 5,
+                 delays: Optional[Dict[str, float]] = None,
+                 action_timeout: float = 30.0):
+        """
+        Initialize a table.
+
+        Args:
+            host: Owning host (provides the event loop and logger)
+            table_id: Host-unique table number
+            game_code: Join code for this table
+            seats: Players per table (2-12)
+            num_rounds: Rounds per game
+            delays: Pacing overrides (see DEFAULT_DELAYS)
+            action_timeout: Seconds before the bot takes a trump/bid/play turn
+        """
+        self.host = host
+        self.table_id = table_id
+        self.game_code = game_code
+        self.seats = seats
+        self.delays = {**DEFAULT_DELAYS, **(delays or {})}
+        self.action_timeout = action_timeout
+        self.logger = host.logger
+
+        self.game = GameState(num_players=seats, num_rounds=num_rounds)
+        self.connections: Dict[str, asyncio.StreamWriter] = {}
+        self.codecs: Dict[str, str] = {}
+        self.event_log = EventLog()
+        self.round_number = 0
+
+        # Which action the table is waiting on: (kind, player_id)
+        self.awaiting: Optional[tuple] = None
+        self._step_handle: Optional[asyncio.TimerHandle] = None
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+
+    # ---------- Seating ----------
+
+    def is_open(self) -> bool:
+        """Check if the table is still accepting new players."""
+        return self.game.phase == GamePhase.LOBBY and len(self.game.players) < self.seats
+
+    def is_finished(self) -> bool:
+        """Check if the game ended and every player left."""
+        return self.game.phase == GamePhase.GAME_END and not self.connections
+
+    def has_player(self, player_id: str) -> bool:
+        return self.game.get_player(player_id) is not None
+
+    def seat_player(self, player_id: str, player_name: str,
+                    writer: asyncio.StreamWriter, codec: str = CODEC_JSON,
+                    last_seq: Optional[int] = None) -> bool:
+        """
+        Seat a new player or rebind a returning one.
+
+        Args:
+            player_id: Player's unique ID
+            player_name: Display name
+            writer: Stream writer for this connection
+            codec: Wire codec negotiated for this connection
+            last_seq: Last broadcast seq a reconnecting client applied
+
+        Returns:
+            True if the player now holds a seat at this table
+        """
+        player = self.game.get_player(player_id)
+        if player:
+            # Reconnect: rebind socket and resend the current table state
+            old = self.connections.get(player_id)
+            if old and old is not writer:
+                old.close()
+            self.connections[player_id] = writer
+            self.codecs[player_id] = codec
+            player.is_connected = True
+            self.logger.info(f"[table {self.table_id}] {player.name} reconnected")
+            if self.game.phase != GamePhase.LOBBY:
+                self.send_state_resync(player_id, last_seq)
+            self._broadcast_lobby_update()
+            return True
+
+        if not self.is_open():
+            return False
+        if not self.game.add_player(Player(player_id, player_name)):
+            return False
+        self.connections[player_id] = writer
+        self.codecs[player_id] = codec
+        self.logger.info(f"[table {self.table_id}] {player_name} joined "
+                         f"({len(self.game.players)}/{self.seats})")
+        self._broadcast_lobby_update()
+        return True
+
+    def seat_bot(self, name: Optional[str] = None) -> Optional[str]:
+        """
+        Fill an open seat with a bot (always ready).
+
+        Returns:
+            The bot's player ID, or None if the table is not open
+        """
+        if not self.is_open():
+            return None
+        player = Player(f"bot-{uuid.uuid4().hex[:8]}", name or f"Bot {len(self.game.players) + 1}")
+        player.is_connected = False
+        self.game.add_player(player)
+        self.mark_ready(player.player_id)
+        return player.player_id
+
+    def is_bot_seat(self, player_id: str) -> bool:
+        """True if the bot acts for this seat (no live connection)."""
+        return player_id not in self.connections
+
+    def mark_disconnected(self, player_id: str, writer: asyncio.StreamWriter):
+        """Drop a player's connection; lobby seats are released, game seats kept."""
+        if self.connections.get(player_id) is not writer:
+            return  # Already replaced by a reconnect
+        del self.connections[player_id]
+        self.codecs.pop(player_id, None)
+        player = self.game.get_player(player_id)
+        if not player:
+            return
+        if self.game.phase == GamePhase.LOBBY:
+            self.game.remove_player(player_id)
+        else:
+            player.is_connected = False
+        self.logger.info(f"[table {self.table_id}] {player.name} disconnected")
+        self.broadcast(MessageHandler.create_player_disconnect(player_id, 'Connection lost'))
+        self._broadcast_lobby_update()
+        if self.awaiting and self.awaiting[1] == player_id:
+            self._take_over_turn()
+
+    def mark_ready(self, player_id: str):
+        """Mark player ready and start the game once every seat is ready."""
+        player = self.game.get_player(player_id)
+        if not player or self.game.phase != GamePhase.LOBBY:
+            return
+        player.is_ready = True
+        self._broadcast_lobby_update()
+        if self.game.all_players_ready():
+            self._start_game()
+
+    # ---------- Messaging ----------
+
+    def create_message(self, msg_type: str, data: Dict) -> Dict:
+        """Standardize outbound messages with round/phase/timestamp."""
+        return {
+            'type': msg_type,
+            'round_number': self.round_number,
+            'phase': self.game.phase.lower(),
+            'timestamp': time.time(),
+            **data,
+        }
+
+    def broadcast(self, message: Dict, exclude: Optional[str] = None):
+        """Encode once per codec and queue on every connected writer (sequenced unless exclude is set)."""
+        if exclude is None:
+            self.event_log.stamp_broadcast(message)
+        encoded = {}
+        for player_id, writer in list(self.connections.items()):
+            if player_id != exclude:
+                codec = self.codecs.get(player_id, CODEC_JSON)
+                data = encoded.get(codec)
+                if data is None:
+                    data = encoded[codec] = MessageHandler.encode(message, codec)
+                self.host.write_message(writer, data)
+
+    def send_to_player(self, player_id: str, message: Dict, record: bool = True) -> bool:
+        """Queue a message for one player (logged for resync); False if they are not connected."""
+        if record:
+            self.event_log.record_private(player_id, message)
+        writer = self.connections.get(player_id)
+        if not writer:
+            return False
+        self.host.write_message(writer, MessageHandler.encode(
+            message, self.codecs.get(player_id, CODEC_JSON)))
+        return True
+
+    def _broadcast_lobby_update(self):
+        players = [{
+            'player_id': p.player_id,
+            'player_name': p.name,
+            'is_ready': p.is_ready,
+            'is_bot': p.player_id.startswith('bot-'),
+        } for p in self.game.players]
+        self.broadcast(MessageHandler.create_lobby_update(players, self.seats))
+
+    def handle_message(self, player_id: str, message: Dict):
+        """
+        Process a message received from a seated player.
+
+        Args:
+            player_id: Sender's ID
+            message: Decoded message dictionary
+        """
+        msg_type = message.get('type')
+
+        if msg_type in ('trump_selected', MessageType.TRUMP_SELECTED):
+            self.handle_trump_selection(player_id, message.get('trump_suit'))
+        elif msg_type == MessageType.READY:
+            self.mark_ready(player_id)
+        elif msg_type == MessageType.STATE_SYNC_REQUEST:
+            self.send_state_resync(player_id, message.get('last_seq'))
+        elif msg_type in ('bid', MessageType.BID_MADE):
+            self.handle_bid(player_id, message.get('amount'))
+        elif msg_type in ('play', MessageType.CARD_PLAYED):
+            self.handle_card_played(player_id, message.get('card'))
+
+    # ---------- Scheduling ----------
+
+    def _schedule(self, delay_key: str, callback: Callable):
+        """Run the next game step after the configured delay."""
+        self._step_handle = self.host.loop.call_later(self.delays[delay_key], callback)
+
+    def _start_action_timeout(self, callback: Callable):
+        self._cancel_action_timeout()
+        self._timeout_handle = self.host.loop.call_later(self.action_timeout, callback)
+
+    def _cancel_action_timeout(self):
+        if self._timeout_handle:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+
+    def _run_bot(self, decide: Callable, apply: Callable):
+        """Run a blocking bot decision off the loop, then apply its result on the loop."""
+        future = self.host.loop.run_in_executor(None, decide)
+
+        def done(fut: asyncio.Future):
+            if fut.cancelled():
+                return
+            if fut.exception():
+                self.logger.warning(f"[table {self.table_id}] bot error: {fut.exception()}")
+                return
+            apply(fut.result())
+        future.add_done_callback(done)
+
+    def _take_over_turn(self):
+        """Let the bot answer whatever the table is waiting on."""
+        if not self.awaiting:
+            return
+        kind, player_id = self.awaiting
+        player = self.game.get_player(player_id)
+        bot = self.host.bot
+        if kind == 'trump':
+            self._run_bot(lambda: bot.choose_trump(player.hand, self.seats),
+                          lambda suit: self._bot_apply_trump(player_id, suit))
+        elif kind == 'bid':
+            trump_suit = self.game.current_trump_suit
+            self._run_bot(lambda: bot.choose_bid(player.hand, trump_suit, self.seats),
+                          lambda bid: self.handle_bid(player_id, bid, auto=True))
+        elif kind == 'play':
+            valid_cards = self.game.get_valid_cards_for_current_player()
+            view = build_play_view(
+                player,
+                self.game.players,
+                self.game.current_trick,
+                [t['cards'] for t in self.game.tricks_history],
+                self.game.current_trump_suit,
+                self.game.num_decks,
+            )
+            self._run_bot(lambda: bot.choose_card(view, valid_cards),
+                          lambda card: self._bot_apply_card(player_id, card))
+
+    def _bot_apply_trump(self, player_id: str, trump_suit: str):
+        if self.awaiting == ('trump', player_id):
+            self._apply_trump(trump_suit, auto_selected=True)
+
+    def _bot_apply_card(self, player_id: str, card: Card):
+        if self.awaiting == ('play', player_id):
+            self._cancel_action_timeout()
+            self.handle_card_played(player_id, str(card))
+
+    def close(self):
+        """Cancel pending timers and close all player connections."""
+        for handle in (self._step_handle, self._timeout_handle):
+            if handle:
+                handle.cancel()
+        for writer in self.connections.values():
+            writer.close()
+        self.connections.clear()
+
+    # ---------- Game flow ----------
+
+    def _start_game(self):
+        self.game.start_game()  # Shuffles seating and deals round 1
+        self.round_number = self.game.current_round
+        self.logger.info(f"[table {self.table_id}] game started")
+        self.broadcast(MessageHandler.create_game_start(
+            player_order=self.game.player_order,
+            dealer=self.game.player_order[self.game.dealer_index],
+            num_decks=self.game.num_decks,
+            num_rounds=self.game.num_rounds,
+        ))
+        self._schedule('round_start', self._announce_round)
+
+    def _announce_round(self):
+        """Send round start and each player's hand for the freshly dealt round."""
+        self.round_number = self.game.current_round
+        self.broadcast(self.create_message(MessageType.ROUND_START, {
+            'total_rounds': self.game.num_rounds,
+        }))
+        for player in self.game.players:
+            self.send_to_player(player.player_id, self.create_message(MessageType.CARDS_DEALT, {
+                'cards': player.get_hand_strings(),
+                'num_cards': len(player.hand),
+            }))
+        self._schedule('trump_selection', self._start_trump_selection)
+
+    def _start_trump_selection(self):
+        chooser = self.game.get_player(self.game.trump_chooser_id)
+        if self.game.phase != GamePhase.TRUMP_SELECTION:
+            # Classic mode already fixed trump during dealing
+            self._announce_trump(self.game.current_trump_suit, '', auto_selected=True)
+            return
+        self.broadcast(self.create_message(MessageType.TRUMP_CHOOSER_SELECTED, {
+            'player_id': chooser.player_id,
+            'player_name': chooser.name,
+        }))
+        self.awaiting = ('trump', chooser.player_id)
+        if self.is_bot_seat(chooser.player_id):
+            self._take_over_turn()
+            return
+        self._send_trump_request(chooser.player_id)
+        self._start_action_timeout(self._take_over_turn)
+
+    def _send_trump_request(self, chooser_id: str):
+        self.send_to_player(chooser_id, self.create_message(MessageType.TRUMP_SELECTION_REQUEST, {
+            'chooser_id': chooser_id,
+            'available_suits': list(SUITS),
+            'timeout_seconds': self.action_timeout,
+        }))
+
+    def handle_trump_selection(self, player_id: str, trump_suit: Optional[str]):
+        if self.awaiting != ('trump', player_id):
+            return
+        if trump_suit not in SUITS:
+            self.send_to_player(player_id, MessageHandler.create_error('Invalid trump suit', 'INVALID_TRUMP'))
+            return
+        self._apply_trump(trump_suit, auto_selected=False)
+
+    def _apply_trump(self, trump_suit: str, auto_selected: bool):
+        self._cancel_action_timeout()
+        self.awaiting = None
+        self.game.set_trump_suit(trump_suit)
+        self._announce_trump(trump_suit, self.game.trump_chooser_id or '', auto_selected)
+
+    def _announce_trump(self, trump_suit: str, chooser_id: str, auto_selected: bool):
+        chooser = self.game.get_player(chooser_id)
+        self.broadcast(self.create_message(MessageType.TRUMP_SELECTED, {
+            'chooser_id': chooser_id,
+            'chooser_name': chooser.name if chooser else '',
+            'trump_suit': trump_suit,
+            'auto_selected': auto_selected,
+        }))
+        self._schedule('next_bid', self._request_next_bid)
+
+    def _request_next_bid(self):
+        player = self.game.get_current_player()
+        self.awaiting = ('bid', player.player_id)
+        bids_so_far = sum(1 for p in self.game.players if p.current_bid > 0)
+        self.broadcast(self.create_message(MessageType.BIDDING_STATUS, {
+            'current_bidder': player.name,
+            'bids_so_far': bids_so_far,
+            'total_players': self.seats,
+        }), exclude=player.player_id)
+        if self.is_bot_seat(player.player_id):
+            self._take_over_turn()
+            return
+        self._send_bid_turn(player)
+        self._start_action_timeout(self._take_over_turn)
+
+    def _suggest_bid(self, player: Player) -> int:
+        return self.host.bot.choose_bid(player.hand, self.game.current_trump_suit, self.seats)
+
+    def _send_bid_turn(self, player: Player):
+        self.send_to_player(player.player_id, self.create_message(MessageType.BID_TURN, {
+            'player_id': player.player_id,
+            'player_name': player.name,
+            'min_bid': 1,
+            'max_bid': len(player.hand),
+            'suggested_bid': self._suggest_bid(player),
+            'timeout_seconds': self.action_timeout,
+        }))
+
+    def handle_bid(self, player_id: str, amount, auto: bool = False):
+        if self.awaiting != ('bid', player_id):
+            return
+        try:
+            amount = int(amount)
+        except (TypeError, ValueError):
+            amount = 0
+        success, reason = self.game.place_bid(player_id, amount)
+        if not success:
+            self.send_to_player(player_id, MessageHandler.create_error(reason, 'INVALID_BID'))
+            return
+        self._cancel_action_timeout()
+        self.awaiting = None
+        player = self.game.get_player(player_id)
+        bids_received = sum(1 for p in self.game.players if p.current_bid > 0)
+        self.broadcast(self.create_message(MessageType.BID_MADE, {
+            'player_id': player_id,
+            'player_name': player.name,
+            'amount': amount,
+            'auto_bid': auto,
+            'bids_received': bids_received,
+            'total_players': self.seats,
+        }))
+        if self.game.phase == GamePhase.PLAYING:
+            self.broadcast(self.create_message(MessageType.BIDDING_COMPLETE, {
+                'all_bids': {p.player_id: p.current_bid for p in self.game.players},
+            }))
+            self._schedule('playing_start', self._request_next_card)
+        else:
+            self._schedule('next_bid', self._request_next_bid)
+
+    def _request_next_card(self):
+        player = self.game.get_current_player()
+        self.awaiting = ('play', player.player_id)
+        self.broadcast(self.create_message(MessageType.PLAYING_STATUS, {
+            'current_player': player.name,
+            'trick_size': len(self.game.current_trick),
+        }), exclude=player.player_id)
+        if self.is_bot_seat(player.player_id):
+            self._take_over_turn()
+            return
+        self._send_play_turn(player)
+        self._start_action_timeout(self._take_over_turn)
+
+    def _send_play_turn(self, player: Player):
+        valid_cards = self.game.get_valid_cards_for_current_player()
+        self.send_to_player(player.player_id, self.create_message(MessageType.PLAY_TURN, {
+            'player_id': player.player_id,
+            'player_name': player.name,
+            'valid_cards': [str(c) for c in valid_cards],
+            'led_suit': self.game.led_suit,
+            'trick_number': len(self.game.tricks_history) + 1,
+        }))
+
+    def handle_card_played(self, player_id: str, card_str: Optional[str]):
+        if self.awaiting != ('play', player_id):
+            return
+        try:
+            card = Card.from_string(card_str or '')
+        except ValueError:
+            self.send_to_player(player_id, MessageHandler.create_error('Invalid card', 'INVALID_CARD'))
+            return
+        tricks_before = len(self.game.tricks_history)
+        trick_cards = [(pid, str(c)) for pid, c in self.game.current_trick] + [(player_id, str(card))]
+        success, reason = self.game.play_card(player_id, card)
+        if not success:
+            self.send_to_player(player_id, MessageHandler.create_error(reason, 'INVALID_CARD'))
+            return
+        self._cancel_action_timeout()
+        self.awaiting = None
+        player = self.game.get_player(player_id)
+        self.broadcast(self.create_message(MessageType.CARD_PLAYED, {
+            'player_id': player_id,
+            'player_name': player.name,
+            'card': str(card),
+            'trick_cards': trick_cards,
+        }))
+        if len(self.game.tricks_history) > tricks_before:
+            self._schedule('next_card', self._announce_trick)
+        else:
+            self._schedule('next_card', self._request_next_card)
+
+    def _announce_trick(self):
+        trick = self.game.tricks_history[-1]
+        winner_card = next(c for pid, c in trick['cards'] if pid == trick['winner_id'])
+        self.broadcast(self.create_message(MessageType.TRICK_WON, {
+            'winner_id': trick['winner_id'],
+            'winner_name': trick['winner_name'],
+            'winning_card': winner_card,
+            'cards': trick['cards'],
+            'tricks_won_count': {p.player_id: p.tricks_won_this_round for p in self.game.players},
+        }))
+        if self.game.phase == GamePhase.PLAYING:
+            self._schedule('next_trick', self._request_next_card)
+        else:
+            self._schedule('next_trick', self._announce_round_end)
+
+    def _announce_round_end(self):
+        summary = self.game.round_history[-1]
+        self.broadcast(self.create_message(MessageType.ROUND_END, {
+            'scores': summary['scores'],
+            'total_scores': summary['total_scores'],
+            'tricks_won': summary['tricks_won'],
+            'bids': summary['bids'],
+        }))
+        self.logger.info(f"[table {self.table_id}] round {self.round_number} complete")
+        if self.game.phase == GamePhase.GAME_END:
+            self._schedule('game_end', self._announce_game_end)
+        else:
+            self._schedule('next_round', self._start_next_round)
+
+    def _start_next_round(self):
+        self.game.continue_to_next_round()
+        self._announce_round()
+
+    def _announce_game_end(self):
+        winner = max(self.game.players, key=lambda p: p.total_score)
+        self.broadcast(self.create_message(MessageType.GAME_END, {
+            'final_scores': {p.player_id: p.total_score for p in self.game.players},
+            'winner_id': winner.player_id,
+            'winner_name': winner.name,
+            'all_round_scores': self.game.round_history,
+        }))
+        self.logger.info(f"[table {self.table_id}] game complete, winner {winner.name}")
+
+    # ---------- State sync ----------
+
+    def _resend_pending_request(self, player_id: str):
+        """Repeat the trump/bid/play prompt if the returning player owes an action."""
+        if not self.awaiting or self.awaiting[1] != player_id:
+            return
+        kind = self.awaiting[0]
+        player = self.game.get_player(player_id)
+        if kind == 'trump':
+            self._send_trump_request(player_id)
+        elif kind == 'bid':
+            self._send_bid_turn(player)
+        elif kind == 'play':
+            self._send_play_turn(player)
+
+    def send_state_resync(self, player_id: str, last_seq: Optional[int]):
+        """
+        Replay the events a returning player missed, or fall back to a snapshot.
+
+        Args:
+            player_id: Returning player
+            last_seq: Last broadcast seq the client applied (None forces a snapshot)
+        """
+        events = self.event_log.since(player_id, last_seq)
+        if events is None:
+            self.send_state_snapshot(player_id)
+            self._resend_pending_request(player_id)
+            return
+        self.logger.info(f"[table {self.table_id}] delta resync for {player_id}: "
+                         f"{len(events)} events after seq {last_seq}")
+        for event in events:
+            self.send_to_player(player_id, event, record=False)
+
+    def build_state_snapshot(self, player_id: str) -> Dict:
+        """Build the snapshot payload described in docs/state_sync_plan.md."""
+        players = self.game.players
+        current = self.game.get_current_player()
+        snapshot = {
+            'seq': self.event_log.seq,
+            'round_number': self.round_number,
+            'phase': self.game.phase.lower(),
+            'player_order': list(self.game.player_order),
+            'trump_suit': self.game.current_trump_suit,
+            'trump_chooser_id': self.game.trump_chooser_id,
+            'bids': {p.player_id: p.current_bid for p in players},
+            'tricks_won_count': {p.player_id: p.tricks_won_this_round for p in players},
+            'scores': {
+                'round': {p.player_id: p.score_this_round for p in players},
+                'total': {p.player_id: p.total_score for p in players},
+            },
+            'current_trick': [(pid, str(c)) for pid, c in self.game.current_trick],
+            'trick_number': len(self.game.tricks_history) + (1 if self.game.current_trick else 0),
+            'current_player_id': None,
+            'current_bidder_id': None,
+        }
+        if current and self.game.phase == GamePhase.BIDDING:
+            snapshot['current_bidder_id'] = current.player_id
+        if current and self.game.phase == GamePhase.PLAYING:
+            snapshot['current_player_id'] = current.player_id
+
+        requester = self.game.get_player(player_id)
+        snapshot['hands'] = {
+            'self': requester.get_hand_strings() if requester else [],
+            'others': {p.player_id: len(p.hand) for p in players if p.player_id != player_id},
+        }
+        if requester and snapshot['current_player_id'] == player_id:
+            snapshot['valid_cards'] = [str(c) for c in self.game.get_valid_cards_for_current_player()]
+        if requester and snapshot['current_bidder_id'] == player_id:
+            snapshot['min_bid'] = 1
+            snapshot['max_bid'] = len(requester.hand)
+        return snapshot
+
+    def send_state_snapshot(self, player_id: str):
+        snapshot = self.build_state_snapshot(player_id)
+        self.send_to_player(player_id, MessageHandler.create_state_sync_snapshot(snapshot))
+
+    def get_table_info(self) -> Dict:
+        """Get table summary for host info/monitoring."""
+        return {
+            'table_id': self.table_id,
+            'game_code': self.game_code,
+            'seats': self.seats,
+            'players': len(self.game.players),
+            'connected': len(self.connections),
+            'phase': self.game.phase,
+            'round_number': self.round_number,
+        }
+
+
+class AsyncGameHost:
+    """
+    Headless multi-table Call Break host built on asyncio streams.
+
+    Each connection is served by a coroutine instead of an OS thread, and
+    game pacing uses loop timers instead of Kivy Clock, so one process can
+    run hundreds of tables.
+
+    Clients are seated by the optional 'game_code' field of their join
+    message; joins without a code fill the first open table, creating new
+    tables on demand.
+
+    Attributes:
+        host: IP address to bind to
+        port: Port to listen on (actual port after start)
+        seats: Default players per table
+        num_rounds: Rounds per game
+        max_tables: Upper bound on concurrently hosted tables
+        tables: Active tables keyed by game code
+        running: Server running state
+        bot: Bot shared by every table for empty/disconnected/timed-out seats
+        bot_seats: Seats pre-filled with bots on each new table
+    """
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 5555, seats: int = 4,
+                 num_rounds: int = 5, max_tables: int = 256,
+                 delays: Optional[Dict[str, float]] = None,
+                 action_timeout: float = 30.0,
+                 bot: Optional[Bot] = None, bot_seats: int = 0):
+        """
+        Initialize the async host.
+
+        Args:
+            host: IP to bind to (0.0.0.0 for all interfaces)
+            port: Port number (0 for an ephemeral port)
+            seats: Default players per table (2-12)
+            num_rounds: Rounds per game
+            max_tables: Maximum concurrent tables
+            delays: Pacing overrides applied to every table
+            action_timeout: Seconds before the bot takes a trump/bid/play turn
+            bot: Bot for seats without a live player (MonteCarloBot by default)
+            bot_seats: Bots seated at every new table (0 to seats)
+        """
+        if not 2 <= seats <= 12:
+            raise ValueError("seats must be between 2 and 12")
+        self.host = host
+        self.port = port
+        self.seats = seats
+        self.num_rounds = num_rounds
+        self.max_tables = max_tables
+        self.delays = delays
+        self.action_timeout = action_timeout
+        self.bot = bot or MonteCarloBot()
+        self.bot_seats = bot_seats
+
+        self.tables: Dict[str, TableSession] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.running = False
+        self.local_ip = GameCodeManager.get_local_ip()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._next_table_id = 1
+
+        self.logger = logging.getLogger('AsyncGameHost')
+
+        # Network safety limits (same as WiFiGameServer)
+        self.max_message_size = 1024 * 512
+        self.handshake_timeout = 10.0
+        self.max_write_buffer = 1024 * 1024  # Drop peers that stop reading
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> int:
+        """
+        Start listening.
+
+        Returns:
+            The bound port
+        """
+        self.loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.running = True
+        self.logger.info(f"Async host listening on {self.local_ip}:{self.port}")
+        return self.port
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled."""
+        if not self._server:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Close every table and the listening socket."""
+        self.running = False
+        for code, table in list(self.tables.items()):
+            table.close()
+            GameCodeManager.unregister(code)
+        self.tables.clear()
+        if hasattr(self.bot, 'shutdown'):
+            self.bot.shutdown()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    # ---------- Tables ----------
+
+    def create_table(self, seats: Optional[int] = None,
+                     num_rounds: Optional[int] = None) -> Optional[TableSession]:
+        """
+        Create and register a new table.
+
+        Args:
+            seats: Players for this table (defaults to host seats)
+            num_rounds: Rounds for this table (defaults to host num_rounds)
+
+        Returns:
+            The new table, or None if max_tables is reached
+        """
+        self._reap_finished_tables()
+        if len(self.tables) >= self.max_tables:
+            return None
+        code = GameCodeManager.generate_code()
+        while code in self.tables:
+            code = GameCodeManager.generate_code()
+        table = TableSession(
+            self, self._next_table_id, code,
+            seats=seats or self.seats,
+            num_rounds=num_rounds or self.num_rounds,
+            delays=self.delays,
+            action_timeout=self.action_timeout,
+        )
+        self._next_table_id += 1
+        self.tables[code] = table
+        GameCodeManager.register(code, self.local_ip, self.port, f"Table {table.table_id}")
+        for _ in range(min(self.bot_seats, table.seats)):
+            table.seat_bot()
+        return table
+
+    def _reap_finished_tables(self):
+        for code, table in list(self.tables.items()):
+            if table.is_finished():
+                table.close()
+                del self.tables[code]
+                GameCodeManager.unregister(code)
+
+    def _find_table(self, player_id: str, game_code: Optional[str]) -> Optional[TableSession]:
+        """Pick the table for a join: reconnect seat, requested code, or first open table."""
+        for table in self.tables.values():
+            if table.has_player(player_id):
+                return table
+        if game_code:
+            return self.tables.get(game_code.strip().upper())
+        for table in self.tables.values():
+            if table.is_open():
+                return table
+        return self.create_table()
+
+    # ---------- Stream helpers ----------
+
+    def write_message(self, writer: asyncio.StreamWriter, payload: bytes):
+        """Queue a length-prefixed payload without blocking the loop."""
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > self.max_write_buffer:
+            self.logger.warning("Closing connection with full write buffer")
+            writer.close()
+            return
+        writer.write(len(payload).to_bytes(4, 'big') + payload)
+
+    async def _read_message(self, reader: asyncio.StreamReader) -> Optional[Dict]:
+        """Read a single length-prefixed JSON message with bounds checking."""
+        try:
+            header = await reader.readexactly(4)
+            length = int.from_bytes(header, 'big')
+            if length <= 0 or length > self.max_message_size:
+                self.logger.warning(f"Rejected message of size {length}")
+                return None
+            payload = await reader.readexactly(length)
+            return MessageHandler.decode(payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+        except ValueError as exc:
+            self.logger.warning(f"Receive error: {exc}")
+            return None
+
+    # ---------- Connection handling ----------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Serve one client: handshake, seat, then dispatch until EOF."""
+        table = None
+        player_id = None
+        try:
+            try:
+                message = await asyncio.wait_for(self._read_message(reader), self.handshake_timeout)
+            except asyncio.TimeoutError:
+                message = None
+            if not message or message.get('type') != MessageType.PLAYER_JOIN:
+                return
+
+            player_id = message.get('player_id')
+            player_name = message.get('player_name', 'Unknown')
+            codec = negotiate_codec(message.get('codecs'))
+            if codec != CODEC_JSON:
+                # Acknowledge in JSON; everything after it uses the chosen codec
+                self.write_message(writer, MessageHandler.encode(MessageHandler.create_codec_selected(codec)))
+            table = self._find_table(player_id, message.get('game_code'))
+            if not table or not table.seat_player(player_id, player_name, writer, codec,
+                                                  message.get('last_seq')):
+                self.write_message(writer, MessageHandler.encode(
+                    MessageHandler.create_error('No seat available', 'TABLE_FULL')))
+                table = None
+                return
+
+            while self.running:
+                message = await self._read_message(reader)
+                if not message:
+                    break
+                if message.get('type') == MessageType.PLAYER_DISCONNECT:
+                    break
+                table.handle_message(player_id, message)
+        finally:
+            if table:
+                table.mark_disconnected(player_id, writer)
+            writer.close()
+
+    def get_server_info(self) -> Dict:
+        """Get host information for display/monitoring."""
+        return {
+            'ip': self.local_ip,
+            'port': self.port,
+            'running': self.running,
+            'table_count': len(self.tables),
+            'player_count': sum(len(t.connections) for t in self.tables.values()),
+            'tables': [t.get_table_info() for t in self.tables.values()],
+        }
+
+
+async def _serve_bot_tables(host: AsyncGameHost):
+    """Serve joins while always keeping one bot-only table in play (soak runs)."""
+    await host.start()
+    while True:
+        if all(t.game.phase == GamePhase.GAME_END for t in host.tables.values()):
+            host.create_table()
+        await asyncio.sleep(1.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless multi-table Call Break host')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5555)
+    parser.add_argument('--seats', type=int, default=4, help='Players per table (2-12)')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--max-tables', type=int, default=256)
+    parser.add_argument('--fast', action='store_true', help='Disable pacing delays')
+    parser.add_argument('--bots', type=int, default=0, help='Bot seats per table (= seats for soak runs)')
+    parser.add_argument('--bot', default='montecarlo', choices=sorted(BOT_TYPES))
+    parser.add_argument('--bot-budget', type=float, default=DEFAULT_TIME_BUDGET,
+                        help='Seconds per bot card decision')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    host = AsyncGameHost(
+        host=args.host,
+        port=args.port,
+        seats=args.seats,
+        num_rounds=args.rounds,
+        max_tables=args.max_tables,
+        delays=FAST_DELAYS if args.fast else None,
+        bot=create_bot(args.bot, **({'time_budget': args.bot_budget} if args.bot == 'montecarlo' else {})),
+        bot_seats=args.bots,
+    )
+    if args.bots >= args.seats:
+        # Bot-only tables need no joins; open one so the soak run starts immediately
+        asyncio.run(_serve_bot_tables(host))
+        return
+    try:
+        asyncio.run(host.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
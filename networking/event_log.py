@@ -0,0 +1,112 @@
+"""
+Sequence-numbered event log for delta resync.
+
+Every table broadcast is stamped with a monotonic 'seq' and kept in a
+bounded ring together with the private messages (hands, turn prompts) sent
+between broadcasts. A returning client reports the last seq it applied and
+gets only what it missed; when the ring no longer reaches back that far the
+host falls back to a full state_sync_snapshot.
+
+Status messages (STATUS_TYPES) carry no seq: each one supersedes the last,
+so they are never replayed and may be coalesced by a lagging connection's
+outbound queue. The same goes for broadcasts that exclude a player, which
+would otherwise show the excluded player a gap.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from .message_handler import MessageType
+
+DEFAULT_CAPACITY = 1024  # About four 12-player rounds of broadcasts plus prompts
+
+# Superseded-by-the-next-one status messages: unsequenced, never replayed
+STATUS_TYPES = frozenset((
+    MessageType.LOBBY_UPDATE,
+    MessageType.BIDDING_STATUS,
+    MessageType.PLAYING_STATUS,
+))
+
+# Replies that describe the resync itself are never replayed
+UNLOGGED_TYPES = frozenset((
+    MessageType.STATE_SYNC_SNAPSHOT,
+    MessageType.CODEC_SELECTED,
+    MessageType.ERROR,
+))
+
+
+class EventLog:
+    """
+    Bounded ring of recent table events.
+
+    Entries are (seq, player_id, message): player_id is None for broadcasts,
+    which take the next seq, and names the recipient for private messages,
+    which are tagged with the seq of the broadcast they follow.
+
+    Attributes:
+        capacity: Maximum number of events kept
+        seq: Seq of the latest broadcast (0 before the first)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize the log.
+
+        Args:
+            capacity: Maximum number of events kept in the ring
+        """
+        self.capacity = capacity
+        self.seq = 0
+        self._events = deque()
+        self._floor = -1  # Highest seq tag evicted from the ring
+        self.lock = threading.Lock()
+
+    def _append(self, entry: tuple):
+        if len(self._events) >= self.capacity:
+            self._floor = self._events.popleft()[0]
+        self._events.append(entry)
+
+    def stamp_broadcast(self, message: Dict) -> Optional[int]:
+        """
+        Assign the next seq to a broadcast (in place) and record it.
+
+        Returns:
+            The assigned seq, or None for status messages
+        """
+        if message.get('type') in STATUS_TYPES:
+            return None
+        with self.lock:
+            self.seq += 1
+            message['seq'] = self.seq
+            self._append((self.seq, None, message))
+            return self.seq
+
+    def record_private(self, player_id: str, message: Dict):
+        """Record a message sent to one player so it can be replayed to them."""
+        msg_type = message.get('type')
+        if msg_type in UNLOGGED_TYPES or msg_type in STATUS_TYPES:
+            return
+        with self.lock:
+            self._append((self.seq, player_id, message))
+
+    def since(self, player_id: str, last_seq: Optional[int]) -> Optional[List[Dict]]:
+        """
+        Collect the events a player missed after applying last_seq.
+
+        Args:
+            player_id: Returning player
+            last_seq: Last broadcast seq the player applied
+
+        Returns:
+            Messages to replay in order, or None if a snapshot is needed
+        """
+        if not isinstance(last_seq, int) or isinstance(last_seq, bool):
+            return None
+        with self.lock:
+            if last_seq > self.seq or last_seq <= self._floor:
+                return None
+            return [
+                message for seq, target, message in self._events
+                if (target is None and seq > last_seq) or (target == player_id and seq >= last_seq)
+            ]
@@ -0,0 +1,164 @@
+"""
+Per-connection outbound queues for the threaded WiFi server.
+
+Game events enqueue already-encoded frames and return immediately; each
+connection's writer thread drains its own queue, so one phone with a full
+TCP window no longer stalls broadcasts to everyone else.
+
+While a client is behind, superseded status messages (lobby, bidding and
+playing status) are coalesced in place, keeping only the newest. A peer
+that still overflows the queue, or blocks a single send for longer than the
+stall timeout, is handled by the backpressure policy.
+"""
+
+import select
+import socket
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from .event_log import STATUS_TYPES
+
+POLICY_DISCONNECT = 'disconnect'  # Close the connection; the bot covers the seat until they rejoin
+POLICY_DROP = 'drop'  # Discard new frames; the client's seq gap check triggers a delta resync
+POLICIES = (POLICY_DISCONNECT, POLICY_DROP)
+
+DEFAULT_QUEUE_LIMIT = 256
+DEFAULT_STALL_TIMEOUT = 5.0
+
+# Never block inside send(): the server's sockets have a timeout set (non-blocking
+# internally); MSG_DONTWAIT covers plain blocking sockets where the platform has it
+_SEND_FLAGS = getattr(socket, 'MSG_DONTWAIT', 0)
+
+
+class OutboundQueue:
+    """
+    Bounded frame queue drained by a dedicated writer thread.
+
+    Attributes:
+        player_id: Connection owner
+        conn: Client socket (shared with the reader thread)
+        limit: Maximum frames waiting to be sent
+        policy: POLICY_DISCONNECT or POLICY_DROP when the queue is full
+        stall_timeout: Seconds a send may block before the peer is too slow
+        stats: Counters (sent, bytes, coalesced, dropped, high_water)
+    """
+
+    def __init__(self, player_id: str, conn: socket.socket,
+                 limit: int = DEFAULT_QUEUE_LIMIT, policy: str = POLICY_DISCONNECT,
+                 stall_timeout: float = DEFAULT_STALL_TIMEOUT,
+                 on_slow_peer: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize the queue and start its writer thread.
+
+        Args:
+            player_id: Connection owner
+            conn: Connected client socket
+            limit: Maximum queued frames
+            policy: Backpressure policy for a full queue (see POLICIES)
+            stall_timeout: Seconds before a blocked send counts as a slow peer
+            on_slow_peer: Called with (player_id, reason) before a slow peer is closed
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.player_id = player_id
+        self.conn = conn
+        self.limit = limit
+        self.policy = policy
+        self.stall_timeout = stall_timeout
+        self.on_slow_peer = on_slow_peer
+        self.stats: Dict[str, int] = {'sent': 0, 'bytes': 0, 'coalesced': 0, 'dropped': 0, 'high_water': 0}
+
+        self._pending = deque()  # [msg_type, frame] pairs; lists so coalescing can swap the frame
+        self._ready = threading.Condition()
+        self._closed = False
+        self._writer = threading.Thread(target=self._drain, name=f"send-{player_id[:8]}", daemon=True)
+        self._writer.start()
+
+    def put(self, payload: bytes, msg_type: Optional[str] = None) -> bool:
+        """
+        Queue an encoded message without blocking.
+
+        Args:
+            payload: Encoded message (length prefix is added here)
+            msg_type: Message type, used to coalesce superseded status messages
+
+        Returns:
+            False if the frame was dropped or the connection is closed
+        """
+        frame = len(payload).to_bytes(4, 'big') + payload
+        with self._ready:
+            if self._closed:
+                return False
+            if msg_type in STATUS_TYPES:
+                for entry in self._pending:
+                    if entry[0] == msg_type:
+                        entry[1] = frame
+                        self.stats['coalesced'] += 1
+                        return True
+            if len(self._pending) >= self.limit:
+                if self.policy == POLICY_DROP:
+                    self.stats['dropped'] += 1
+                    return False
+                overflow = True
+            else:
+                overflow = False
+                self._pending.append([msg_type, frame])
+                self.stats['high_water'] = max(self.stats['high_water'], len(self._pending))
+                self._ready.notify()
+        if overflow:
+            self._slow_peer(f"outbound queue full ({self.limit} frames)")
+            return False
+        return True
+
+    def pending(self) -> int:
+        """Number of frames waiting to be sent."""
+        with self._ready:
+            return len(self._pending)
+
+    def close(self):
+        """Stop the writer; frames still queued are discarded."""
+        with self._ready:
+            self._closed = True
+            self._pending.clear()
+            self._ready.notify()
+
+    def _drain(self):
+        while True:
+            with self._ready:
+                while not self._pending and not self._closed:
+                    self._ready.wait()
+                if self._closed:
+                    return
+                frame = self._pending.popleft()[1]
+            try:
+                self._send_all(frame)
+            except socket.timeout:
+                self._slow_peer(f"send blocked for {self.stall_timeout:.1f}s")
+                return
+            except OSError:
+                self.close()  # Reader thread notices the dead socket and reports the disconnect
+                return
+            self.stats['sent'] += 1
+            self.stats['bytes'] += len(frame)
+
+    def _send_all(self, frame: bytes):
+        """sendall with a per-chunk stall timeout independent of the socket's recv timeout."""
+        view = memoryview(frame)
+        while view:
+            _, writable, _ = select.select([], [self.conn], [], self.stall_timeout)
+            if not writable:
+                raise socket.timeout()
+            try:
+                view = view[self.conn.send(view, _SEND_FLAGS):]
+            except (BlockingIOError, InterruptedError):
+                continue
+
+    def _slow_peer(self, reason: str):
+        self.close()
+        if self.on_slow_peer:
+            self.on_slow_peer(self.player_id, reason)
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
@@ -0,0 +1,345 @@
+"""
+Compact binary wire codec for Call Break messages.
+
+A drop-in alternative to the JSON encoding used by MessageHandler. Peers
+opt in during the PLAYER_JOIN handshake (see negotiate_codec); JSON stays
+the default so older clients keep working. Binary frames start with
+MAGIC, which can never begin a JSON object, so decoders tell the two
+apart from the first byte.
+
+Frame layout (inside the existing 4-byte length prefix):
+
+    B magic, B flags, B message type ID
+    [B round_number]        if FLAG_ROUND
+    [B phase ID]            if FLAG_PHASE
+    [I seconds, H millis]   if FLAG_TIMESTAMP
+    body                    tagged values (zlib-compressed if FLAG_ZLIB)
+
+The body is the rest of the message as a dict of tagged values. Known keys
+and strings (message types, phases, suits, field names) are one-byte
+references into KNOWN_STRINGS. Card codes like '10D' are one byte. Small
+ints are one byte. Repeated strings such as player IDs are back
+references. Decoding returns what MessageHandler.decode would return for
+the JSON form (tuples come back as lists), except that the header
+timestamp is kept to the millisecond.
+
+KNOWN_STRINGS and MESSAGE_TYPES are part of the protocol: append only.
+"""
+
+import struct
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+
+CODEC_JSON = 'json'
+CODEC_BINARY = 'binary'
+SUPPORTED_CODECS = (CODEC_BINARY, CODEC_JSON)  # Preference order
+
+MAGIC = 0xCB
+WIRE_VERSION = 1
+
+FLAG_ZLIB = 0x01
+FLAG_ROUND = 0x02
+FLAG_PHASE = 0x04
+FLAG_TIMESTAMP = 0x08
+FLAG_VERSION_SHIFT = 4
+
+COMPRESS_THRESHOLD = 512  # Body bytes before zlib is attempted
+COMPRESS_LEVEL = 6
+
+UNKNOWN_TYPE = 0xFF
+
+MESSAGE_TYPES = (
+    'join', 'lobby_update', 'disconnect', 'ready', 'game_start', 'cards_dealt',
+    'round_start', 'bid_turn', 'bid_made', 'bidding_status', 'bidding_complete',
+    'trump_chooser', 'trump_request', 'trump_chosen', 'play_turn', 'playing_status',
+    'card_played', 'trick_won', 'round_end', 'game_end', 'state_sync_request',
+    'state_sync_snapshot', 'player_rejoin', 'error', 'codec_selected',
+    'trump_selected', 'bid', 'play',
+)  # MessageType values
+TYPE_IDS = {name: i for i, name in enumerate(MESSAGE_TYPES)}
+
+PHASES = (
+    'lobby', 'game_start', 'dealing', 'trump_selection', 'bidding', 'playing',
+    'trick_end', 'round_end', 'game_end',
+)
+PHASE_IDS = {name: i for i, name in enumerate(PHASES)}
+
+KNOWN_STRINGS = MESSAGE_TYPES + PHASES + tuple(p.upper() for p in PHASES) + (
+    'Spades', 'Hearts', 'Diamonds', 'Clubs',
+    'type', 'player_id', 'player_name', 'round_number', 'phase', 'timestamp',
+    'amount', 'card', 'cards', 'trick_cards', 'valid_cards', 'led_suit', 'trick_number',
+    'current_player', 'trick_size', 'current_bidder', 'bids_so_far', 'total_players',
+    'min_bid', 'max_bid', 'suggested_bid', 'timeout_seconds', 'auto_bid', 'bids_received',
+    'winner_id', 'winner_name', 'winning_card', 'tricks_won_count', 'scores',
+    'total_scores', 'tricks_won', 'bids', 'final_scores', 'all_round_scores', 'winner',
+    'players', 'ready_count', 'max_players', 'is_ready', 'is_bot', 'chooser_id',
+    'chooser_name', 'trump_suit', 'auto_selected', 'available_suits', 'player_order',
+    'dealer', 'num_decks', 'num_rounds', 'total_rounds', 'num_cards', 'all_bids',
+    'message', 'error_code', 'reason', 'hands', 'self', 'others', 'current_trick',
+    'trump_chooser_id', 'current_player_id', 'current_bidder_id', 'round', 'total',
+    'game_code', 'codecs', 'codec', CODEC_JSON, CODEC_BINARY,
+    'seq', 'last_seq',
+)
+KNOWN_IDS = {s: i for i, s in enumerate(KNOWN_STRINGS)}
+assert len(KNOWN_STRINGS) <= 256
+
+SUIT_LETTERS = 'SHDC'
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+CARD_CODES = tuple(rank + suit for suit in SUIT_LETTERS for rank in RANKS)  # == card_id order
+CARD_IDS = {code: i for i, code in enumerate(CARD_CODES)}
+
+# Value tags; 0x80-0xFF encode small ints 0-127 inline
+T_NONE, T_TRUE, T_FALSE = 0, 1, 2
+T_INT32, T_INT64, T_FLOAT, T_TENTHS = 3, 4, 5, 6
+T_STR, T_REF, T_KNOWN, T_CARD = 7, 8, 9, 10
+T_LIST, T_DICT = 11, 12
+SMALL_INT = 0x80
+
+_HEADER = struct.Struct('>BBB')
+_TIMESTAMP = struct.Struct('>IH')
+_INT32 = struct.Struct('>i')
+_INT64 = struct.Struct('>q')
+_FLOAT = struct.Struct('>d')
+
+
+def negotiate_codec(offered: Optional[Iterable[str]]) -> str:
+    """
+    Pick the wire codec for a connection from the client's join offer.
+
+    Args:
+        offered: 'codecs' list from the PLAYER_JOIN message (None for old clients)
+
+    Returns:
+        CODEC_BINARY or CODEC_JSON
+    """
+    if offered and not isinstance(offered, str):
+        offered = set(offered)
+        for codec in SUPPORTED_CODECS:
+            if codec in offered:
+                return codec
+    return CODEC_JSON
+
+
+def is_binary(data: bytes) -> bool:
+    """True if a frame payload was produced by encode_binary."""
+    return bool(data) and data[0] == MAGIC
+
+
+# ---------- Encoding ----------
+
+def _put_varint(out: bytearray, n: int):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_str(out: bytearray, value: str, strings: Dict[str, int]):
+    known = KNOWN_IDS.get(value)
+    if known is not None:
+        out.append(T_KNOWN)
+        out.append(known)
+        return
+    card = CARD_IDS.get(value)
+    if card is not None:
+        out.append(T_CARD)
+        out.append(card)
+        return
+    ref = strings.get(value)
+    if ref is not None:
+        out.append(T_REF)
+        _put_varint(out, ref)
+        return
+    raw = value.encode('utf-8')
+    out.append(T_STR)
+    _put_varint(out, len(raw))
+    out += raw
+    strings[value] = len(strings)
+
+
+def _put(out: bytearray, value: Any, strings: Dict[str, int]):
+    kind = type(value)
+    if kind is str:
+        _put_str(out, value, strings)
+    elif kind is int:
+        if 0 <= value < 0x80:
+            out.append(SMALL_INT | value)
+        elif -0x80000000 <= value <= 0x7FFFFFFF:
+            out.append(T_INT32)
+            out += _INT32.pack(value)
+        else:
+            out.append(T_INT64)
+            out += _INT64.pack(value)
+    elif kind is list or kind is tuple:
+        out.append(T_LIST)
+        _put_varint(out, len(value))
+        for item in value:
+            _put(out, item, strings)
+    elif kind is dict:
+        out.append(T_DICT)
+        _put_varint(out, len(value))
+        for key, item in value.items():
+            if type(key) is not str:
+                if type(key) is not int:
+                    raise ValueError(f"Unsupported key type: {type(key).__name__}")
+                key = str(key)  # Same as JSON
+            _put_str(out, key, strings)
+            _put(out, item, strings)
+    elif kind is float:
+        tenths = round(value * 10)
+        if abs(tenths) <= 0x7FFFFFFF and tenths / 10 == value:
+            out.append(T_TENTHS)
+            out += _INT32.pack(tenths)
+        else:
+            out.append(T_FLOAT)
+            out += _FLOAT.pack(value)
+    elif value is None:
+        out.append(T_NONE)
+    elif kind is bool:
+        out.append(T_TRUE if value else T_FALSE)
+    else:
+        raise ValueError(f"Unsupported value type: {kind.__name__}")
+
+
+def encode_binary(message: Dict[str, Any], compress_threshold: int = COMPRESS_THRESHOLD) -> bytes:
+    """
+    Encode a message dict as a binary frame payload.
+
+    Args:
+        message: Message dictionary with a 'type' field
+        compress_threshold: Body size that triggers zlib (0 disables)
+
+    Returns:
+        Frame payload bytes (without the 4-byte length prefix)
+    """
+    flags = WIRE_VERSION << FLAG_VERSION_SHIFT
+    head = bytearray()
+    body = dict(message)
+    type_id = TYPE_IDS.get(body.get('type'), UNKNOWN_TYPE)
+    if type_id != UNKNOWN_TYPE:
+        del body['type']
+
+    round_number = body.get('round_number')
+    if type(round_number) is int and 0 <= round_number <= 0xFF:
+        flags |= FLAG_ROUND
+        head.append(round_number)
+        del body['round_number']
+    phase_id = PHASE_IDS.get(body.get('phase'))
+    if phase_id is not None:
+        flags |= FLAG_PHASE
+        head.append(phase_id)
+        del body['phase']
+    timestamp = body.get('timestamp')
+    if type(timestamp) is float and 0 <= timestamp < 0xFFFFFFFF:
+        seconds = int(timestamp)
+        millis = int(round((timestamp - seconds) * 1000))
+        if millis == 1000:
+            seconds, millis = seconds + 1, 0
+        flags |= FLAG_TIMESTAMP
+        head += _TIMESTAMP.pack(seconds, millis)
+        del body['timestamp']
+
+    out = bytearray()
+    _put(out, body, {})
+    if compress_threshold and len(out) >= compress_threshold:
+        packed = zlib.compress(bytes(out), COMPRESS_LEVEL)
+        if len(packed) < len(out):
+            flags |= FLAG_ZLIB
+            out = packed
+    return _HEADER.pack(MAGIC, flags, type_id) + bytes(head) + bytes(out)
+
+
+# ---------- Decoding ----------
+
+def _get_varint(data: bytes, pos: int):
+    shift = result = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _get(data: bytes, pos: int, strings: List[str]):
+    tag = data[pos]
+    pos += 1
+    if tag >= SMALL_INT:
+        return tag & 0x7F, pos
+    if tag == T_KNOWN:
+        return KNOWN_STRINGS[data[pos]], pos + 1
+    if tag == T_CARD:
+        return CARD_CODES[data[pos]], pos + 1
+    if tag == T_REF:
+        ref, pos = _get_varint(data, pos)
+        return strings[ref], pos
+    if tag == T_STR:
+        length, pos = _get_varint(data, pos)
+        value = data[pos:pos + length].decode('utf-8')
+        strings.append(value)
+        return value, pos + length
+    if tag == T_LIST:
+        count, pos = _get_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _get(data, pos, strings)
+            items.append(item)
+        return items, pos
+    if tag == T_DICT:
+        count, pos = _get_varint(data, pos)
+        result = {}
+        for _ in range(count):
+            key, pos = _get(data, pos, strings)
+            result[key], pos = _get(data, pos, strings)
+        return result, pos
+    if tag == T_INT32:
+        return _INT32.unpack_from(data, pos)[0], pos + 4
+    if tag == T_TENTHS:
+        return _INT32.unpack_from(data, pos)[0] / 10, pos + 4
+    if tag == T_FLOAT:
+        return _FLOAT.unpack_from(data, pos)[0], pos + 8
+    if tag == T_INT64:
+        return _INT64.unpack_from(data, pos)[0], pos + 8
+    if tag == T_NONE:
+        return None, pos
+    if tag == T_TRUE:
+        return True, pos
+    if tag == T_FALSE:
+        return False, pos
+    raise ValueError(f"Unknown value tag {tag}")
+
+
+def decode_binary(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a binary frame payload.
+
+    Raises:
+        ValueError: If the payload is not a valid binary frame
+    """
+    try:
+        magic, flags, type_id = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or flags >> FLAG_VERSION_SHIFT != WIRE_VERSION:
+            raise ValueError("Not a binary frame of this version")
+        pos = _HEADER.size
+        message = {}
+        if type_id != UNKNOWN_TYPE:
+            message['type'] = MESSAGE_TYPES[type_id]
+        if flags & FLAG_ROUND:
+            message['round_number'] = data[pos]
+            pos += 1
+        if flags & FLAG_PHASE:
+            message['phase'] = PHASES[data[pos]]
+            pos += 1
+        if flags & FLAG_TIMESTAMP:
+            seconds, millis = _TIMESTAMP.unpack_from(data, pos)
+            message['timestamp'] = seconds + millis / 1000
+            pos += _TIMESTAMP.size
+        body = data[pos:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        fields, _ = _get(body, 0, [])
+        message.update(fields)
+        return message
+    except (struct.error, IndexError, zlib.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed binary frame: {e}")
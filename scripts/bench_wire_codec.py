@@ -0,0 +1,111 @@
+"""Compare the binary wire codec with JSON on real game traffic.
+
+Plays one game on a headless AsyncGameHost (one scripted client plus bots),
+records every message the client receives, then reports per message type
+the average frame size and encode/decode time for each codec.
+
+Usage: python scripts/bench_wire_codec.py [--players 12] [--rounds 1] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from game.bots import GreedyBot  # noqa: E402
+from networking.async_server import AsyncGameHost, FAST_DELAYS  # noqa: E402
+from networking.message_handler import MessageHandler, MessageType  # noqa: E402
+from networking.wire_codec import CODEC_BINARY, CODEC_JSON  # noqa: E402
+
+
+async def _send(writer, message):
+    payload = MessageHandler.encode(message)
+    writer.write(len(payload).to_bytes(4, 'big') + payload)
+    await writer.drain()
+
+
+async def record_game(players: int, rounds: int) -> list:
+    """Play a game against bots and return every message the client received."""
+    host = AsyncGameHost(host='127.0.0.1', port=0, seats=players, num_rounds=rounds,
+                         delays=FAST_DELAYS, bot=GreedyBot(), bot_seats=players - 1)
+    port = await host.start()
+    received = []
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        player_id = str(uuid.uuid4())
+        await _send(writer, MessageHandler.create_player_join(player_id, 'Bench'))
+        await _send(writer, MessageHandler.create_ready(player_id))
+        while True:
+            header = await reader.readexactly(4)
+            message = MessageHandler.decode(await reader.readexactly(int.from_bytes(header, 'big')))
+            received.append(message)
+            msg_type = message['type']
+            if msg_type == MessageType.TRUMP_SELECTION_REQUEST:
+                await _send(writer, {'type': MessageType.TRUMP_SELECTED, 'trump_suit': 'Spades'})
+            elif msg_type == MessageType.BID_TURN:
+                await _send(writer, {'type': MessageType.BID_MADE, 'amount': message['min_bid']})
+            elif msg_type == MessageType.PLAY_TURN:
+                await _send(writer, {'type': MessageType.CARD_PLAYED, 'card': message['valid_cards'][0]})
+            elif msg_type == MessageType.GAME_END:
+                break
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.05)  # Let the host see EOF before it stops
+    finally:
+        await host.stop()
+    return received
+
+
+def measure(messages: list, codec: str, repeat: int):
+    """Return (total bytes, encode µs, decode µs) per message type."""
+    stats = defaultdict(lambda: [0, 0.0, 0.0])
+    for message in messages:
+        entry = stats[message['type']]
+        data = MessageHandler.encode(message, codec)
+        entry[0] += len(data)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            MessageHandler.encode(message, codec)
+        entry[1] += (time.perf_counter() - start) / repeat * 1e6
+        start = time.perf_counter()
+        for _ in range(repeat):
+            MessageHandler.decode(data)
+        entry[2] += (time.perf_counter() - start) / repeat * 1e6
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark binary wire codec against JSON")
+    parser.add_argument('--players', type=int, default=12)
+    parser.add_argument('--rounds', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=200, help="Timing repetitions per message")
+    args = parser.parse_args()
+
+    messages = asyncio.run(record_game(args.players, args.rounds))
+    counts = defaultdict(int)
+    for message in messages:
+        counts[message['type']] += 1
+    as_json = measure(messages, CODEC_JSON, args.repeat)
+    as_binary = measure(messages, CODEC_BINARY, args.repeat)
+
+    print(f"{len(messages)} messages, {args.players} players, {args.rounds} round(s)")
+    print(f"{'type':<22}{'n':>5}{'json B':>9}{'bin B':>8}{'ratio':>7}"
+          f"{'json enc/dec µs':>18}{'bin enc/dec µs':>17}")
+    totals = [0, 0]
+    for msg_type in sorted(counts, key=lambda t: -as_json[t][0]):
+        n = counts[msg_type]
+        j, b = as_json[msg_type], as_binary[msg_type]
+        totals[0] += j[0]
+        totals[1] += b[0]
+        print(f"{msg_type:<22}{n:>5}{j[0] / n:>9.0f}{b[0] / n:>8.0f}{b[0] / j[0]:>7.2f}"
+              f"{j[1] / n:>9.1f}/{j[2] / n:<8.1f}{b[1] / n:>8.1f}/{b[2] / n:<8.1f}")
+    print(f"{'total':<22}{len(messages):>5}{totals[0]:>9}{totals[1]:>8}{totals[1] / totals[0]:>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
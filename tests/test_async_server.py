@@ -0,0 +1,102 @@
+"""
+Integration tests for the headless asyncio host.
+
+Run with: pytest tests/test_async_server.py
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from networking.async_server import AsyncGameHost, FAST_DELAYS
+from networking.message_handler import MessageHandler, MessageType
+
+
+async def send(writer, message):
+    payload = MessageHandler.encode(message)
+    writer.write(len(payload).to_bytes(4, 'big') + payload)
+    await writer.drain()
+
+
+async def recv(reader):
+    header = await reader.readexactly(4)
+    return MessageHandler.decode(await reader.readexactly(int.from_bytes(header, 'big')))
+
+
+async def play_client(port, name, game_code=None):
+    """Minimal WiFiGameClient-compatible player: join, ready, then auto-act."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    player_id = str(uuid.uuid4())
+    join = MessageHandler.create_player_join(player_id, name)
+    if game_code:
+        join['game_code'] = game_code
+    await send(writer, join)
+    await send(writer, MessageHandler.create_ready(player_id))
+    seen = []
+    while True:
+        message = await recv(reader)
+        seen.append(message['type'])
+        msg_type = message['type']
+        if msg_type == MessageType.TRUMP_SELECTION_REQUEST:
+            await send(writer, {'type': MessageType.TRUMP_SELECTED, 'trump_suit': 'Hearts'})
+        elif msg_type == MessageType.BID_TURN:
+            await send(writer, {'type': MessageType.BID_MADE, 'amount': 1})
+        elif msg_type == MessageType.PLAY_TURN:
+            await send(writer, {'type': MessageType.CARD_PLAYED, 'card': message['valid_cards'][0]})
+        elif msg_type == MessageType.GAME_END:
+            writer.close()
+            return seen, message
+
+
+def run_tables(num_tables, seats, num_rounds=1):
+    async def scenario():
+        host = AsyncGameHost(host='127.0.0.1', port=0, seats=seats,
+                             num_rounds=num_rounds, delays=FAST_DELAYS)
+        port = await host.start()
+        try:
+            clients = [play_client(port, f"P{i}") for i in range(num_tables * seats)]
+            results = await asyncio.wait_for(asyncio.gather(*clients), timeout=30)
+            return host, results
+        finally:
+            await host.stop()
+    return asyncio.run(scenario())
+
+
+def test_many_tables_play_to_game_end():
+    host, results = run_tables(num_tables=3, seats=4)
+    assert len(results) == 12
+    for seen, game_end in results:
+        assert seen.count(MessageType.TRICK_WON) == 13
+        assert MessageType.ROUND_END in seen
+        assert len(game_end['final_scores']) == 4
+
+
+@pytest.mark.parametrize('seats', [2, 7, 12])
+def test_table_sizes_and_deck_configs(seats):
+    _, results = run_tables(num_tables=1, seats=seats)
+    for seen, game_end in results:
+        assert MessageType.CARDS_DEALT in seen
+        assert len(game_end['final_scores']) == seats
+
+
+def test_join_by_game_code():
+    async def scenario():
+        host = AsyncGameHost(host='127.0.0.1', port=0, seats=2, num_rounds=1, delays=FAST_DELAYS)
+        port = await host.start()
+        try:
+            table = host.create_table()
+            results = await asyncio.wait_for(asyncio.gather(
+                play_client(port, 'A', table.game_code),
+                play_client(port, 'B', table.game_code),
+            ), timeout=30)
+            return table, results
+        finally:
+            await host.stop()
+
+    table, results = asyncio.run(scenario())
+    assert table.game.phase == 'GAME_END'
+    assert {pid for pid in results[0][1]['final_scores']} == set(table.game.player_order)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,104 @@
+"""
+Tests for the bid expectation table and the vectorized simulator.
+
+Run with: pytest tests/test_bid_table.py
+"""
+
+import json
+import random
+
+import pytest
+from game.bid_table import TABLE_VERSION, load_bid_table, shape_features, suggest_bid
+from game.card import Card, Deck, get_deck_config
+from game.card_engine import ID_RANK, ID_SUIT, NO_SUIT, suit_index
+from game.player import Player
+from game.trick_validator import get_valid_cards
+
+np = pytest.importorskip('numpy')
+from game import simulator  # noqa: E402
+
+
+def cards(*codes):
+    return [Card.from_string(code) for code in codes]
+
+
+class TestShippedTable:
+
+    def test_covers_every_player_count(self):
+        table = load_bid_table()
+        assert table is not None and table.version == TABLE_VERSION
+        for num_players in range(2, 13):
+            _, cards_per_player, _ = get_deck_config(num_players)
+            assert table.configs[num_players]['cards'] == cards_per_player
+
+    def test_strong_hand_bids_higher(self):
+        strong = cards('AS', 'KS', 'QS', 'JS', '10S', '9S', 'AH', 'KH', 'AD', 'KD', 'AC', 'KC', '2C')
+        weak = cards('2S', '3H', '4H', '5H', '6H', '7D', '8D', '9D', '2C', '3C', '4C', '5C', '6C')
+        assert suggest_bid(strong, 'Spades', 4) > suggest_bid(weak, 'Spades', 4) >= 1
+        assert suggest_bid(strong, 'Spades', 4) <= 13
+
+    def test_missing_or_old_table(self, tmp_path):
+        assert load_bid_table(str(tmp_path / 'missing.json')) is None
+        old = tmp_path / 'old.json'
+        old.write_text(json.dumps({'version': TABLE_VERSION + 1, 'configs': {}}))
+        assert load_bid_table(str(old)) is None
+
+
+@pytest.mark.parametrize('num_players', [2, 4, 6, 7, 9, 12])
+def test_batch_deal_and_play(num_players):
+    _, cards_per_player, _ = get_deck_config(num_players)
+    rng = np.random.default_rng(3)
+    hands = simulator.deal_batch(rng, num_players, 64)
+    assert (hands.sum(axis=2) == cards_per_player).all()
+    trump = simulator.choose_trump(rng, hands)
+    codes = simulator.shape_codes(hands, trump)
+
+    for b in range(8):
+        for seat in range(num_players):
+            ids = [cid for cid in range(52) for _ in range(hands[b, seat, cid])]
+            assert simulator.decode_shape(codes[b, seat]) == shape_features(ids, int(trump[b]))
+
+    tricks = simulator.play_batch(hands, trump, rng.integers(num_players, size=64))
+    assert (tricks.sum(axis=1) == cards_per_player).all()
+    assert not hands.any()
+
+
+def test_legal_mask_matches_validator():
+    rng = random.Random(5)
+    for _ in range(300):
+        deck = Deck(2)
+        rng.shuffle(deck.cards)
+        hands, _ = deck.deal(8)
+        trump_suit = rng.choice(Card.SUITS)
+        trick = [(f"p{i}", hands[i].pop()) for i in range(rng.randrange(8))]
+        player = Player('me', 'Me')
+        player.hand = hands[-1]
+        led_suit = trick[0][1].suit if trick else None
+        trump = suit_index(trump_suit)
+        high = max([ID_RANK[c.card_id] for _, c in trick if ID_SUIT[c.card_id] == trump], default=-1)
+
+        has = np.zeros((1, 52), dtype=bool)
+        has[0, [c.card_id for c in player.hand]] = True
+        mask = simulator.legal_mask(has, np.array([suit_index(led_suit) if trick else NO_SUIT]),
+                                    np.array([trump]), np.array([high]))
+        expected = {c.card_id for c in get_valid_cards(player, trick, led_suit, trump_suit)}
+        assert set(np.flatnonzero(mask[0])) == expected
+
+
+def test_score_matrix_uses_calculate_score():
+    scores = simulator.score_matrix(13)
+    assert scores[5, 5] == 5.0
+    assert scores[6, 3] == pytest.approx(3.3)
+    assert scores[2, 4] == -4.0
+
+
+def test_build_config_is_reproducible():
+    first = simulator.build_config(4, 500, seed=9, min_samples=5)
+    assert first == simulator.build_config(4, 500, seed=9, min_samples=5)
+    assert first['default'][2] == 2000
+    for expected, bid, _ in first['shapes'].values():
+        assert 0 <= expected <= 13 and 1 <= bid <= 13
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
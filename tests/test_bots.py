@@ -0,0 +1,163 @@
+"""
+Tests for computer players and their server integration.
+
+Run with: pytest tests/test_bots.py
+"""
+
+import asyncio
+import random
+import time
+import uuid
+
+import pytest
+from game.bots import (
+    GreedyBot,
+    MonteCarloBot,
+    PlayView,
+    RolloutPool,
+    build_play_view,
+    create_bot,
+    determinize,
+)
+from game.card import Card
+from game.game_logic import GamePhase, GameState
+from game.player import Player
+from networking.async_server import AsyncGameHost, FAST_DELAYS
+from networking.message_handler import MessageHandler, MessageType
+
+
+def play_round(num_players, bot):
+    """Play one full round where every seat is the given bot."""
+    game = GameState(num_players, num_rounds=1)
+    for i in range(num_players):
+        player = Player(f"p{i}", f"P{i}")
+        player.is_ready = True
+        game.add_player(player)
+    game.start_game()
+    chooser = game.get_player(game.trump_chooser_id)
+    game.set_trump_suit(bot.choose_trump(chooser.hand, num_players))
+    while game.phase == GamePhase.BIDDING:
+        player = game.get_current_player()
+        bid = bot.choose_bid(player.hand, game.current_trump_suit, num_players)
+        assert game.place_bid(player.player_id, bid)[0]
+    while game.phase == GamePhase.PLAYING:
+        player = game.get_current_player()
+        valid = game.get_valid_cards_for_current_player()
+        view = build_play_view(player, game.players, game.current_trick,
+                               [t['cards'] for t in game.tricks_history],
+                               game.current_trump_suit, game.num_decks)
+        card = bot.choose_card(view, valid)
+        assert card in valid
+        assert game.play_card(player.player_id, card)[0]
+    return game
+
+
+@pytest.mark.parametrize('num_players', [2, 4, 9])
+def test_bots_play_legal_rounds(num_players):
+    bot = MonteCarloBot(time_budget=0.005, pool=RolloutPool(0), seed=3)
+    game = play_round(num_players, bot)
+    assert game.phase in (GamePhase.ROUND_END, GamePhase.GAME_END)
+    assert sum(p.tricks_won_this_round for p in game.players) == game.cards_per_player
+
+
+def test_play_view_hides_other_hands():
+    seats = [Player(f"p{i}", f"P{i}") for i in range(3)]
+    me = seats[2]
+    me.hand = [Card.from_string(s) for s in ('AS', 'KH', '9C')]
+    completed = [[('p0', '5D'), ('p1', '3C'), ('p2', '7D')]]
+    trick = [('p1', Card.from_string('2H'))]
+    view = build_play_view(me, seats, trick, completed, 'Spades', 1)
+    assert len(view.unseen) == 52 - 3 - 4
+    assert view.seat == 2 and view.trick == [Card.from_string('2H').card_id]
+    # p1 failed to follow diamonds without trumping: void in diamonds and trump
+    assert view.voids == [0, (1 << 2) | (1 << 0), 0]
+
+
+def test_determinize_respects_voids():
+    hand = [Card.from_string(s).card_id for s in ('AS', 'KS', 'QS')]
+    unseen = [Card.from_string(s).card_id for s in ('2H', '3H', '4H', '2D', '3D', '4D')]
+    view = PlayView(
+        hand=hand, trump=0, trick=[], seat=0, hand_sizes=[3, 3, 3],
+        unseen=unseen, voids=[0, 1 << 1, 0], bid=1, won=0)
+    for seed in range(20):
+        hands = determinize(view, random.Random(seed))
+        assert hands[1].masks[1] == 0
+        assert sum(len(h) for h in hands) == 9
+
+
+def test_time_budget_with_process_pool():
+    bot = MonteCarloBot(time_budget=0.2, pool=RolloutPool(2), seed=5)
+    try:
+        game = GameState(4, num_rounds=1)
+        for i in range(4):
+            player = Player(f"p{i}", f"P{i}")
+            player.is_ready = True
+            game.add_player(player)
+        game.start_game()
+        game.set_trump_suit('Hearts')
+        player = game.get_current_player()
+        view = build_play_view(player, game.players, [], [], 'Hearts', 1)
+        bot.choose_card(view, list(player.hand))  # warm up worker processes
+        start = time.perf_counter()
+        card = bot.choose_card(view, list(player.hand))
+        assert time.perf_counter() - start < 0.35
+        assert card in player.hand
+    finally:
+        bot.shutdown()
+
+
+def test_create_bot():
+    assert isinstance(create_bot('greedy'), GreedyBot)
+    with pytest.raises(ValueError):
+        create_bot('oracle')
+
+
+async def _send(writer, message):
+    payload = MessageHandler.encode(message)
+    writer.write(len(payload).to_bytes(4, 'big') + payload)
+    await writer.drain()
+
+
+async def _recv(reader):
+    header = await reader.readexactly(4)
+    return MessageHandler.decode(await reader.readexactly(int.from_bytes(header, 'big')))
+
+
+def test_bot_tables_and_disconnect_takeover():
+    async def scenario():
+        host = AsyncGameHost(host='127.0.0.1', port=0, seats=4, num_rounds=1, delays=FAST_DELAYS,
+                             action_timeout=5.0, bot=MonteCarloBot(time_budget=0.005, pool=RolloutPool(0)),
+                             bot_seats=3)
+        port = await host.start()
+        try:
+            # One human joins a table with three bots, then drops at their first card
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            player_id = str(uuid.uuid4())
+            await _send(writer, MessageHandler.create_player_join(player_id, 'Human'))
+            await _send(writer, MessageHandler.create_ready(player_id))
+            while True:
+                msg_type = (await _recv(reader))['type']
+                if msg_type == MessageType.TRUMP_SELECTION_REQUEST:
+                    await _send(writer, {'type': MessageType.TRUMP_SELECTED, 'trump_suit': 'Clubs'})
+                elif msg_type == MessageType.BID_TURN:
+                    await _send(writer, {'type': MessageType.BID_MADE, 'amount': 2})
+                elif msg_type == MessageType.PLAY_TURN:
+                    break
+            writer.close()
+
+            table = next(iter(host.tables.values()))
+            for _ in range(500):
+                if table.game.phase == GamePhase.GAME_END:
+                    break
+                await asyncio.sleep(0.02)
+            return table
+        finally:
+            await host.stop()
+
+    table = asyncio.run(scenario())
+    assert table.game.phase == GamePhase.GAME_END
+    assert sum(table.game.round_history[0]['tricks_won'].values()) == 13
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,141 @@
+"""
+Unit tests for the compact card core and its Card/Player adapters.
+
+Run with: pytest tests/test_card_engine.py
+"""
+
+import random
+
+import pytest
+from game.card import Card, Deck, get_deck_config
+from game.card_engine import (
+    CompactHand,
+    TrickState,
+    hand_masks,
+    iter_mask,
+    suit_index,
+    trick_winner,
+)
+from game.player import Player
+from game.trick_validator import determine_trick_winner, get_valid_cards, validate_card_play
+
+
+def reference_valid_cards(hand, trick, led_suit, trump_suit):
+    """Straightforward list version of the follow/trump/higher-trump rules."""
+    if not trick:
+        return list(hand)
+    led = [c for c in hand if c.suit == led_suit]
+    if led:
+        return led
+    trumps = [c for c in hand if c.suit == trump_suit]
+    if not trumps:
+        return list(hand)
+    played = [c.value for _, c in trick if c.suit == trump_suit]
+    if played:
+        higher = [c for c in trumps if c.value > max(played)]
+        return higher or trumps
+    return trumps
+
+
+def reference_winner(trick, led_suit, trump_suit):
+    trumps = [(i, c) for i, (_, c) in enumerate(trick) if c.suit == trump_suit]
+    pool = trumps or [(i, c) for i, (_, c) in enumerate(trick) if c.suit == led_suit]
+    return max(pool, key=lambda x: x[1].value)[0]
+
+
+def random_positions(num_players, count, seed=7):
+    """Yield (player, trick, led_suit, trump_suit) mid-trick positions."""
+    rng = random.Random(seed)
+    num_decks, _, _ = get_deck_config(num_players)
+    for _ in range(count):
+        deck = Deck(num_decks)
+        rng.shuffle(deck.cards)
+        hands, _ = deck.deal(num_players)
+        trump_suit = rng.choice(Card.SUITS)
+        trick = [(f"p{i}", hands[i].pop()) for i in range(rng.randrange(num_players))]
+        player = Player('me', 'Me')
+        player.hand = hands[-1]
+        led_suit = trick[0][1].suit if trick else None
+        yield player, trick, led_suit, trump_suit
+
+
+class TestInterning:
+    """Cards are shared, immutable and hashable."""
+
+    def test_from_string_returns_shared_instance(self):
+        assert Card.from_string('10D') is Card.from_string('10D')
+        assert Card.from_string('AS') == Card('Spades', 'A')
+
+    def test_from_id_round_trip(self):
+        for cid in range(104):
+            card = Card.from_id(cid)
+            assert card.card_id == cid % 52
+            assert Card.from_string(str(card)) is card
+
+    def test_invalid_string(self):
+        for bad in ('', 'X', '1S', 'AZ'):
+            with pytest.raises(ValueError):
+                Card.from_string(bad)
+
+    def test_hashable_and_slotted(self):
+        assert len({Card.from_string('AS'), Card('Spades', 'A')}) == 1
+        with pytest.raises(AttributeError):
+            Card.from_string('AS').is_trump = True
+
+
+class TestCompactHand:
+
+    def test_duplicate_copies_from_two_decks(self):
+        ace = Card.from_string('AH').card_id
+        hand = CompactHand([ace, ace])
+        assert hand.remove(ace)
+        assert hand.has(ace)
+        assert hand.remove(ace)
+        assert not hand.has(ace)
+        assert not hand.remove(ace)
+        assert hand.masks == [0, 0, 0, 0]
+
+    def test_iter_mask(self):
+        hearts = suit_index('Hearts')
+        ids = [Card.from_string(s).card_id for s in ('2H', '10H', 'AH')]
+        masks = hand_masks(ids)
+        assert list(iter_mask(hearts, masks[hearts])) == ids
+
+
+@pytest.mark.parametrize('num_players', [2, 4, 6, 7, 12])
+def test_valid_cards_match_reference(num_players):
+    for player, trick, led_suit, trump_suit in random_positions(num_players, 300):
+        expected = reference_valid_cards(player.hand, trick, led_suit, trump_suit)
+        assert get_valid_cards(player, trick, led_suit, trump_suit) == expected
+        for card in set(player.hand):
+            is_valid, _ = validate_card_play(player, card, trick, led_suit, trump_suit)
+            assert is_valid == (card in expected)
+
+
+@pytest.mark.parametrize('num_players', [3, 4, 9])
+def test_trick_winner_matches_reference(num_players):
+    for player, trick, _, trump_suit in random_positions(num_players, 300, seed=11):
+        if not trick:
+            continue
+        led_suit = trick[0][1].suit
+        expected = reference_winner(trick, led_suit, trump_suit)
+        assert determine_trick_winner(trick, led_suit, trump_suit)[0] == expected
+
+        ids = [c.card_id for _, c in trick]
+        state = TrickState(suit_index(trump_suit))
+        for cid in ids:
+            state.play(cid)
+        assert state.winner == expected == trick_winner(ids, suit_index(trump_suit))
+
+
+def test_higher_trump_required():
+    player = Player('me', 'Me')
+    player.hand = [Card.from_string(s) for s in ('3S', 'KS', '5D')]
+    trick = [('a', Card.from_string('4H')), ('b', Card.from_string('10S'))]
+    assert get_valid_cards(player, trick, 'Hearts', 'Spades') == [Card.from_string('KS')]
+    assert validate_card_play(player, Card.from_string('3S'), trick, 'Hearts', 'Spades') == \
+        (False, "Must play higher trump if available")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
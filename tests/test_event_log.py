@@ -0,0 +1,130 @@
+"""
+Tests for broadcast sequencing and delta resync.
+
+Run with: pytest tests/test_event_log.py
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from networking.async_server import AsyncGameHost, FAST_DELAYS
+from networking.event_log import EventLog
+from networking.message_handler import MessageHandler, MessageType
+
+
+def test_since_replays_broadcasts_and_own_prompts():
+    log = EventLog(capacity=10)
+    log.stamp_broadcast({'type': 'a'})
+    log.record_private('p1', {'type': 'hand'})
+    log.record_private('p2', {'type': 'hand'})
+    log.stamp_broadcast({'type': 'b'})
+    log.record_private('p1', MessageHandler.create_state_sync_snapshot({}))
+    assert [m['type'] for m in log.since('p1', 1)] == ['hand', 'b']
+    assert [m['type'] for m in log.since('p2', 2)] == []
+    assert [m['type'] for m in log.since('p1', 0)] == ['a', 'hand', 'b']
+
+
+def test_since_needs_snapshot_when_ring_is_short():
+    log = EventLog(capacity=4)
+    for _ in range(6):
+        log.stamp_broadcast({'type': 'x'})
+    assert log.since('p1', 1) is None
+    assert log.since('p1', 2) is None  # seq 2 was evicted; its prompts may have been too
+    assert [m['seq'] for m in log.since('p1', 3)] == [4, 5, 6]
+    assert log.since('p1', 7) is None  # Ahead of the host (e.g. host restarted)
+    assert log.since('p1', None) is None
+
+
+def test_client_holds_out_of_order_broadcasts():
+    from networking.wifi_client import WiFiGameClient
+    client = WiFiGameClient('127.0.0.1')
+    requests = []
+    client.send_state_sync_request = lambda: requests.append(client.last_seq)
+    order = []
+    for seq in (5, 6, 9, None, 7, 8, 9, 10):
+        message = {'type': 'x', 'seq': seq} if seq else {'type': 'prompt'}
+        order += [m.get('seq') for m in client._sequence(message)]
+    assert order == [5, 6, None, 7, 8, 9, 10]
+    assert requests == [6]
+    assert not client.resync_pending
+
+
+async def send(writer, message):
+    payload = MessageHandler.encode(message)
+    writer.write(len(payload).to_bytes(4, 'big') + payload)
+    await writer.drain()
+
+
+async def recv(reader):
+    header = await reader.readexactly(4)
+    return MessageHandler.decode(await reader.readexactly(int.from_bytes(header, 'big')))
+
+
+async def play(reader, writer, stop_after_plays=None):
+    """Answer prompts; return (messages, ended) after GAME_END or the given number of plays."""
+    seen, plays = [], 0
+    while True:
+        message = await recv(reader)
+        seen.append(message)
+        msg_type = message['type']
+        if msg_type == MessageType.TRUMP_SELECTION_REQUEST:
+            await send(writer, {'type': MessageType.TRUMP_SELECTED, 'trump_suit': 'Hearts'})
+        elif msg_type == MessageType.BID_TURN:
+            await send(writer, {'type': MessageType.BID_MADE, 'amount': 1})
+        elif msg_type == MessageType.PLAY_TURN:
+            if plays == stop_after_plays:
+                return seen, False
+            plays += 1
+            await send(writer, {'type': MessageType.CARD_PLAYED, 'card': message['valid_cards'][0]})
+        elif msg_type == MessageType.GAME_END:
+            return seen, True
+
+
+def test_reconnect_receives_only_missed_events():
+    async def scenario():
+        host = AsyncGameHost(host='127.0.0.1', port=0, seats=2, num_rounds=1, delays=FAST_DELAYS,
+                             action_timeout=5.0)
+        port = await host.start()
+        try:
+            async def steady():
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                player_id = str(uuid.uuid4())
+                await send(writer, MessageHandler.create_player_join(player_id, 'Steady'))
+                await send(writer, MessageHandler.create_ready(player_id))
+                return await play(reader, writer)
+
+            async def flaky():
+                player_id = str(uuid.uuid4())
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                await send(writer, MessageHandler.create_player_join(player_id, 'Flaky'))
+                await send(writer, MessageHandler.create_ready(player_id))
+                before, _ = await play(reader, writer, stop_after_plays=3)
+                writer.close()
+                last_seq = max(m['seq'] for m in before if 'seq' in m)
+                await asyncio.sleep(0.1)  # Miss a few events; the bot covers the seat
+
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                join = MessageHandler.create_player_join(player_id, 'Flaky')
+                join['last_seq'] = last_seq
+                await send(writer, join)
+                after, ended = await play(reader, writer)
+                writer.close()
+                return last_seq, after, ended
+
+            _, (last_seq, after, ended) = await asyncio.wait_for(
+                asyncio.gather(steady(), flaky()), timeout=30)
+            return last_seq, after, ended
+        finally:
+            await host.stop()
+
+    last_seq, after, ended = asyncio.run(scenario())
+    assert ended
+    assert not any(m['type'] == MessageType.STATE_SYNC_SNAPSHOT for m in after)
+    seqs = [m['seq'] for m in after if 'seq' in m]
+    assert seqs == list(range(last_seq + 1, last_seq + 1 + len(seqs)))
+    assert len(seqs) > 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,140 @@
+"""
+Tests for per-connection outbound queues and slow-peer backpressure.
+
+Run with: pytest tests/test_outbound_queue.py
+"""
+
+import socket
+import time
+import uuid
+
+import pytest
+from networking.message_handler import MessageHandler, MessageType
+from networking.outbound_queue import POLICY_DISCONNECT, POLICY_DROP, OutboundQueue
+
+
+def stalled_pair():
+    """A connected socket pair whose reading side never reads."""
+    sender, receiver = socket.socketpair()
+    sender.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    return sender, receiver
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_status_messages_coalesce_while_peer_is_behind():
+    sender, receiver = stalled_pair()
+    queue = OutboundQueue('p1', sender, limit=8, policy=POLICY_DISCONNECT, stall_timeout=5.0)
+    try:
+        queue.put(b'x' * 65536, MessageType.CARD_PLAYED)  # Fills the socket buffers
+        for i in range(100):
+            assert queue.put(MessageHandler.encode({'type': MessageType.PLAYING_STATUS, 'trick_size': i}),
+                             MessageType.PLAYING_STATUS)
+            assert queue.put(MessageHandler.encode({'type': MessageType.LOBBY_UPDATE, 'n': i}),
+                             MessageType.LOBBY_UPDATE)
+        assert queue.pending() <= 3
+        assert queue.stats['coalesced'] >= 190
+    finally:
+        queue.close()
+        sender.close()
+        receiver.close()
+
+
+@pytest.mark.parametrize('policy', [POLICY_DISCONNECT, POLICY_DROP])
+def test_full_queue_applies_policy(policy):
+    sender, receiver = stalled_pair()
+    slow = []
+    queue = OutboundQueue('p1', sender, limit=4, policy=policy, stall_timeout=5.0,
+                          on_slow_peer=lambda pid, reason: slow.append(pid))
+    try:
+        start = time.perf_counter()
+        results = [queue.put(b'y' * 65536, MessageType.CARD_PLAYED) for _ in range(20)]
+        assert time.perf_counter() - start < 0.5  # put never blocks on the socket
+        assert not all(results)
+        if policy == POLICY_DISCONNECT:
+            assert slow == ['p1']
+        else:
+            assert slow == [] and queue.stats['dropped'] > 0
+    finally:
+        queue.close()
+        sender.close()
+        receiver.close()
+
+
+def test_stalled_send_disconnects_peer():
+    sender, receiver = stalled_pair()
+    slow = []
+    queue = OutboundQueue('p1', sender, limit=64, stall_timeout=0.2,
+                          on_slow_peer=lambda pid, reason: slow.append(reason))
+    try:
+        queue.put(b'z' * (1 << 20), MessageType.CARD_PLAYED)
+        assert wait_until(lambda: slow)
+        assert 'blocked' in slow[0]
+    finally:
+        queue.close()
+        sender.close()
+        receiver.close()
+
+
+def _join(port, name):
+    conn = socket.create_connection(('127.0.0.1', port))
+    payload = MessageHandler.encode(MessageHandler.create_player_join(str(uuid.uuid4()), name))
+    conn.sendall(len(payload).to_bytes(4, 'big') + payload)
+    return conn
+
+
+def _recv(conn):
+    header = b''
+    while len(header) < 4:
+        header += conn.recv(4 - len(header))
+    length, data = int.from_bytes(header, 'big'), b''
+    while len(data) < length:
+        data += conn.recv(length - len(data))
+    return MessageHandler.decode(data)
+
+
+def test_slow_client_does_not_stall_broadcast():
+    from game.bots import GreedyBot
+    from networking.wifi_server import WiFiGameServer
+
+    server = WiFiGameServer(host='127.0.0.1', port=0, bot=GreedyBot(), send_queue_limit=16)
+    assert server.start()[0]
+    slow = fast = None
+    try:
+        slow = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow.connect(('127.0.0.1', server.port))
+        payload = MessageHandler.encode(MessageHandler.create_player_join('slow', 'Slow'))
+        slow.sendall(len(payload).to_bytes(4, 'big') + payload)
+        fast = _join(server.port, 'Fast')
+        assert wait_until(lambda: len(server.outbound) == 2)
+
+        start = time.perf_counter()
+        for i in range(100):
+            server.broadcast(server.create_message(MessageType.CARD_PLAYED, {'n': i, 'pad': 'x' * 32768}))
+        assert time.perf_counter() - start < 1.0
+
+        received = []
+        while len(received) < 100:
+            message = _recv(fast)
+            if message['type'] == MessageType.CARD_PLAYED:
+                received.append(message['n'])
+        assert received == list(range(100))
+        assert wait_until(lambda: not server.connection_manager.is_connected('slow'))
+    finally:
+        server.stop()
+        for conn in (slow, fast):
+            if conn:
+                conn.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
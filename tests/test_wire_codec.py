@@ -0,0 +1,124 @@
+"""
+Tests for the binary wire codec and its join-time negotiation.
+
+Run with: pytest tests/test_wire_codec.py
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from networking.async_server import AsyncGameHost, FAST_DELAYS
+from networking.message_handler import MessageHandler, MessageType
+from networking.wire_codec import (
+    CARD_CODES,
+    CODEC_BINARY,
+    CODEC_JSON,
+    FLAG_ZLIB,
+    decode_binary,
+    encode_binary,
+    negotiate_codec,
+)
+
+
+def as_json(message):
+    return MessageHandler.decode(MessageHandler.encode(message))
+
+
+@pytest.mark.parametrize('message', [
+    MessageHandler.create_card_played('p-1', '10D', [('p-0', 'AS'), ('p-1', '10D')]),
+    MessageHandler.create_round_end({'a': 3.1, 'b': -2.0, 'c': 1e-9}, {'a': 12.4, 'b': 0.0, 'c': -7.0},
+                                    {'a': 4, 'b': 0, 'c': 9}),
+    {'type': 'custom', 'n': None, 'flags': [True, False], 'big': 2 ** 40, 'neg': -300,
+     'name': 'Ünïcode ♠', 'nested': {'cards': list(CARD_CODES)}},
+    {'type': MessageType.LOBBY_UPDATE, 'round_number': 0, 'phase': 'lobby', 'timestamp': 1700000000.25,
+     'players': [{'player_id': str(uuid.uuid4()), 'player_name': f'P{i}', 'is_ready': True}
+                 for i in range(12)]},
+])
+def test_round_trip_matches_json(message):
+    data = MessageHandler.encode(message, CODEC_BINARY)
+    assert MessageHandler.decode(data) == as_json(message)
+    assert len(data) < len(MessageHandler.encode(message))
+
+
+def test_large_bodies_are_compressed():
+    message = {'type': MessageType.GAME_END, 'all_round_scores': [{'scores': {'p1': 1.1}}] * 200}
+    data = encode_binary(message)
+    assert data[1] & FLAG_ZLIB
+    assert decode_binary(data) == as_json(message)
+
+
+def test_malformed_frames_raise_value_error():
+    data = encode_binary(MessageHandler.create_playing_status('p1', 2))
+    with pytest.raises(ValueError):
+        MessageHandler.decode(data[:-1])
+    with pytest.raises(ValueError):
+        MessageHandler.encode({'type': 'x', 'value': object()}, CODEC_BINARY)
+
+
+def test_negotiate_codec():
+    assert negotiate_codec(None) == CODEC_JSON
+    assert negotiate_codec(['json']) == CODEC_JSON
+    assert negotiate_codec(['msgpack', 'binary']) == CODEC_BINARY
+    assert negotiate_codec('binary') == CODEC_JSON  # Malformed offer
+
+
+async def send(writer, message, codec=CODEC_JSON):
+    payload = MessageHandler.encode(message, codec)
+    writer.write(len(payload).to_bytes(4, 'big') + payload)
+    await writer.drain()
+
+
+async def recv_raw(reader):
+    header = await reader.readexactly(4)
+    return await reader.readexactly(int.from_bytes(header, 'big'))
+
+
+async def play_client(port, name, codecs=None):
+    """Join (optionally offering codecs), ready, auto-act; return raw frames received."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    player_id = str(uuid.uuid4())
+    await send(writer, MessageHandler.create_player_join(player_id, name, codecs=codecs))
+    await send(writer, MessageHandler.create_ready(player_id))
+    codec = CODEC_JSON
+    frames = []
+    while True:
+        data = await recv_raw(reader)
+        frames.append(data)
+        message = MessageHandler.decode(data)
+        msg_type = message['type']
+        if msg_type == MessageType.CODEC_SELECTED:
+            codec = message['codec']
+        elif msg_type == MessageType.TRUMP_SELECTION_REQUEST:
+            await send(writer, {'type': MessageType.TRUMP_SELECTED, 'trump_suit': 'Hearts'}, codec)
+        elif msg_type == MessageType.BID_TURN:
+            await send(writer, {'type': MessageType.BID_MADE, 'amount': 1}, codec)
+        elif msg_type == MessageType.PLAY_TURN:
+            await send(writer, {'type': MessageType.CARD_PLAYED, 'card': message['valid_cards'][0]}, codec)
+        elif msg_type == MessageType.GAME_END:
+            writer.close()
+            return frames
+
+
+def test_binary_and_legacy_json_clients_share_a_table():
+    async def scenario():
+        host = AsyncGameHost(host='127.0.0.1', port=0, seats=2, num_rounds=1, delays=FAST_DELAYS)
+        port = await host.start()
+        try:
+            return await asyncio.wait_for(asyncio.gather(
+                play_client(port, 'Binary', codecs=['binary', 'json']),
+                play_client(port, 'Legacy')), timeout=30)
+        finally:
+            await host.stop()
+
+    binary_frames, json_frames = asyncio.run(scenario())
+    assert json.loads(binary_frames[0])['type'] == MessageType.CODEC_SELECTED
+    assert all(MessageHandler.decode(f) for f in binary_frames[1:])
+    assert all(f[:1] == b'{' for f in json_frames)
+    assert all(f[:1] != b'{' for f in binary_frames[1:])
+    assert sum(map(len, binary_frames)) < sum(map(len, json_frames)) / 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
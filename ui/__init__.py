@@ -0,0 +1,5 @@
+"""
+UI Module for Call Break Game
+
+Contains all Kivy screens and widgets.
+"""
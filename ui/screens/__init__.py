@@ -0,0 +1,11 @@
+"""
+UI Screens Module
+"""
+
+from .lobby_screen import LobbyScreen
+from .game_screen import GameScreen
+from .bidding_screen import BiddingScreen
+from .score_screen import ScoreScreen
+from .horror_intro_screen import HorrorIntroScreen
+
+__all__ = ['LobbyScreen', 'GameScreen', 'BiddingScreen', 'ScoreScreen', 'HorrorIntroScreen']
@@ -0,0 +1,9 @@
+"""
+Custom Widgets Module
+"""
+
+from .card_widget import CardWidget
+from .player_widget import PlayerWidget
+from .trick_display import TrickDisplay
+
+__all__ = ['CardWidget', 'PlayerWidget', 'TrickDisplay']
@@ -0,0 +1,9 @@
+"""
+Utilities Module
+"""
+
+from .helpers import get_local_ip, get_deck_config
+from .permissions import request_all_permissions
+from .logger import setup_logger
+
+__all__ = ['get_local_ip', 'get_deck_config', 'request_all_permissions', 'setup_logger']